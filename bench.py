@@ -0,0 +1,371 @@
+"""Micro-benchmarks for scraper.py. Run: python bench.py <name> [options]"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse, csv, io, statistics, tempfile, threading, time, tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+import scraper
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Tiny keep-alive HTTP/1.1 server standing in for a job board."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b"<html><body><div class='card-content'>ok</div></body></html>"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def local_server(handler=_StandInHandler):
+    """Serve `handler` on an ephemeral localhost port; yields the base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _timed(fn, n: int) -> list[float]:
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def _report(label: str, samples: list[float]):
+    ms = [s * 1000 for s in samples]
+    print(f"{label:<12} mean {statistics.mean(ms):7.3f} ms   "
+          f"p50 {statistics.median(ms):7.3f} ms   total {sum(ms):8.1f} ms")
+
+
+def bench_pool(args):
+    """Per-request latency: fresh connection per GET vs the pooled session."""
+    with local_server() as url:
+        unpooled = _timed(
+            lambda: requests.get(url, headers=scraper.HEADERS, timeout=scraper.TIMEOUT).content,
+            args.requests,
+        )
+        scraper.configure_session(args.pool_size)
+        pooled = _timed(lambda: scraper._get(url).content, args.requests)
+    print(f"{args.requests} GETs against {url}")
+    _report("unpooled", unpooled)
+    _report("pooled", pooled)
+    print(f"speedup      {statistics.mean(unpooled) / statistics.mean(pooled):.2f}x")
+
+
+def bench_parse(args):
+    """Rows/sec for each card extraction backend on one large synthetic page."""
+    page = scraper.synthetic_page(args.cards)
+    print(f"{args.cards} cards, {len(page) / 1e6:.1f} MB of HTML")
+    expected = None
+    for name in scraper.PARSERS:
+        if name == "lxml" and scraper.lxml_html is None:
+            print(f"{name:<12} skipped (lxml not installed)")
+            continue
+        t0 = time.perf_counter()
+        rows = scraper._extract_cards(page, name)
+        elapsed = time.perf_counter() - t0
+        expected = expected or rows
+        same = "same rows" if rows == expected else "ROWS DIFFER"
+        print(f"{name:<12} {len(rows) / elapsed:10.0f} rows/s   {elapsed:6.2f} s   {same}")
+
+
+def bench_topk(args):
+    """--sort + --limit: full sort then slice vs heap-based top-k selection."""
+    rows = scraper.synthetic_rows(args.rows)
+    print(f"{args.rows} rows, --sort {args.sort} --limit {args.limit}")
+    t0 = time.perf_counter()
+    full = scraper._sort_rows(rows, args.sort)[:args.limit]
+    t_full = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    top = scraper._sort_rows(rows, args.sort, args.limit)
+    t_top = time.perf_counter() - t0
+    print(f"full sort    {t_full:7.2f} s")
+    print(f"top-k heap   {t_top:7.2f} s   {'same rows' if top == full else 'ROWS DIFFER'}")
+    print(f"speedup      {t_full / t_top:.2f}x")
+
+
+def _parse_date_baseline(s: str):
+    """_parse_date as it was before memoization: try every format by exception."""
+    for fmt in ("%Y-%m-%d", "%b %d, %Y", "%B %d, %Y"):
+        try:
+            return scraper.datetime.strptime(s, fmt)  # patched by bench_dates to count calls
+        except ValueError:
+            continue
+    return None
+
+
+class _CountingDatetime(datetime):
+    strptime_calls = 0
+
+    @classmethod
+    def strptime(cls, s, fmt):
+        _CountingDatetime.strptime_calls += 1
+        return super().strptime(s, fmt)
+
+
+def bench_dates(args):
+    """strptime calls and time for --since + --sort date, before vs after memoization."""
+    rows = scraper.synthetic_rows(args.rows)
+    if args.format != "%Y-%m-%d":
+        rows = [(t, c, l, datetime.fromisoformat(d).strftime(args.format)) for t, c, l, d in rows]
+    print(f"{args.rows} rows, dates like {rows[-1][3]!r}")
+
+    def run(parse):
+        scraper._parse_date.cache_clear()
+        _CountingDatetime.strptime_calls = 0
+        saved = scraper.datetime, scraper._parse_date
+        scraper.datetime = _CountingDatetime
+        if parse is not None:
+            scraper._parse_date = parse
+        try:
+            t0 = time.perf_counter()
+            out = list(scraper.filter_rows(rows, since_str="2020-01-01", sort_by="date"))
+            elapsed = time.perf_counter() - t0
+        finally:
+            scraper.datetime, scraper._parse_date = saved
+        return out, elapsed, _CountingDatetime.strptime_calls
+
+    base, t_base, n_base = run(_parse_date_baseline)
+    fast, t_fast, n_fast = run(None)
+    print(f"baseline     {n_base:>10} strptime calls   {t_base:6.2f} s")
+    print(f"memoized     {n_fast:>10} strptime calls   {t_fast:6.2f} s   "
+          f"{'same rows' if fast == base else 'ROWS DIFFER'}")
+
+
+def _passes_filters_baseline(row, include, exclude, location, since):
+    """_passes_filters before the compiled matcher: re-lowers every term per row."""
+    title, company, loc, date_str = row
+    blob = f"{title} {company} {loc}".lower()
+    if include and not all(term.lower() in blob for term in include):
+        return False
+    if exclude and any(term.lower() in blob for term in exclude):
+        return False
+    if location and location.lower() not in loc.lower():
+        return False
+    return True
+
+
+def bench_keywords(args):
+    """Rows/sec of include/exclude filtering: per-row term lowering vs compiled matcher."""
+    rows = scraper.synthetic_rows(args.rows)
+    words = sorted({w.strip(",()").lower() for r in rows[:100] for w in " ".join(r[:3]).split()})
+    include = list("eaoirnt"[: args.include])  # common letters keep most rows alive
+    exclude = [f"zz{w}" for w in words[: args.exclude]]  # never match: worst case scans all
+    print(f"{args.rows} rows, {len(include)} include / {len(exclude)} exclude terms")
+
+    t0 = time.perf_counter()
+    base = [r for r in rows if _passes_filters_baseline(r, include, exclude, None, None)]
+    t_base = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fast = list(scraper.filter_rows(rows, include=include, exclude=exclude))
+    t_fast = time.perf_counter() - t0
+    print(f"baseline     {len(rows) / t_base:12.0f} rows/s")
+    print(f"compiled     {len(rows) / t_fast:12.0f} rows/s   {'same rows' if fast == base else 'ROWS DIFFER'}")
+
+
+def _fresh_rows(n: int) -> list[tuple[str, str, str, str]]:
+    """Synthetic rows re-read through csv, so every field is its own string like a real scrape."""
+    buf = io.StringIO()
+    csv.writer(buf).writerows(scraper.synthetic_rows(n))
+    buf.seek(0)
+    return [tuple(r) for r in csv.reader(buf)]
+
+
+def _traced(build):
+    tracemalloc.start()
+    try:
+        obj = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return obj, size
+
+
+def bench_memory(args):
+    """tracemalloc bytes/row: tuples vs the dictionary-encoded JobTable."""
+    print(f"{args.rows} rows")
+    rows, tuples = _traced(lambda: _fresh_rows(args.rows))
+    results = [("tuples", tuples)]
+    table, size = _traced(lambda: scraper.JobTable.from_rows(_fresh_rows(args.rows)))
+    results.append(("JobTable", size))
+    for label, size in results:
+        print(f"{label:<12} {size / args.rows:8.1f} bytes/row   {size / 1e6:8.1f} MB total")
+    assert list(table) == rows
+
+
+def _write_csv_baseline(out_path: Path, rows) -> int:
+    """The CSV writer before bulk writes: default buffer, one writerow(list(r)) per row."""
+    with out_path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(scraper.CSV_HEADER)
+        for r in rows:
+            w.writerow(list(r))
+    return len(rows)
+
+
+def bench_write(args):
+    """MB/s writing CSV: per-row writerow vs the buffered writerows path."""
+    rows = scraper.synthetic_rows(args.rows)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for label, write in (("per-row", _write_csv_baseline), ("bulk", scraper._write_csv)):
+            path = Path(tmp) / f"{label}.csv"
+            t0 = time.perf_counter()
+            write(path, rows)
+            elapsed = time.perf_counter() - t0
+            mb = path.stat().st_size / 1e6
+            print(f"{label:<12} {mb / elapsed:8.1f} MB/s   {elapsed:6.2f} s   {mb:.1f} MB")
+        same = (Path(tmp) / "per-row.csv").read_bytes() == (Path(tmp) / "bulk.csv").read_bytes()
+        print("same bytes" if same else "OUTPUT DIFFERS")
+
+
+def bench_compress(args):
+    """Write throughput vs compression ratio for plain/.gz/.xz/.zst CSV output."""
+    rows = scraper.synthetic_rows(args.rows)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        plain_mb = None
+        for ext in ("csv", "csv.gz", "csv.xz", "csv.zst"):
+            if ext.endswith("zst") and scraper.zstandard is None:
+                print(f"{ext:<10} skipped (zstandard not installed)")
+                continue
+            for level in ([None] if ext == "csv" else args.levels):
+                path = Path(tmp) / f"out.{ext}"
+                t0 = time.perf_counter()
+                scraper._write_csv(path, rows, compress_level=level)
+                elapsed = time.perf_counter() - t0
+                mb = path.stat().st_size / 1e6
+                plain_mb = plain_mb or mb
+                label = ext if level is None else f"{ext} -{level}"
+                print(f"{label:<14} {plain_mb / elapsed:8.1f} MB/s (uncompressed)   "
+                      f"{mb:8.1f} MB   ratio {plain_mb / mb:5.1f}x")
+
+
+def bench_workers(args):
+    """parse_pages over a directory of saved listing pages with 1..N worker processes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(args.corpus or tmp)
+        if not args.corpus:
+            scraper.write_synthetic_pages(corpus, args.pages, args.cards)
+        pages = [p.read_text(encoding="utf-8") for p in sorted(corpus.glob("*.html"))]
+        print(f"{len(pages)} pages, {sum(map(len, pages)) / 1e6:.1f} MB of HTML, --parser {args.parser}")
+        base = expected = None
+        for n in args.workers:
+            t0 = time.perf_counter()
+            rows = scraper.parse_pages(pages, args.parser, n)
+            elapsed = time.perf_counter() - t0
+            base = base or elapsed
+            expected = expected or rows
+            same = "same rows" if rows == expected else "ROWS DIFFER"
+            print(f"workers {n:<3} {len(rows) / elapsed:10.0f} rows/s   {elapsed:6.2f} s   "
+                  f"speedup {base / elapsed:5.2f}x   {same}")
+
+
+def bench_pipeline(args):
+    """scrape_fake_jobs_to_csv end to end over saved pages: parse, filter pipeline, CSV write (no network)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(args.corpus) if args.corpus else Path(tmp) / "pages"
+        if not args.corpus:
+            scraper.write_synthetic_pages(corpus, args.pages, args.cards)
+        pages = scraper.saved_pages([corpus])
+        filters = dict(include=args.include, since_str=args.since, dedupe=args.dedupe, sort_by=args.sort, limit=args.limit)
+        print(f"{len(pages)} pages, --parser {args.parser}, filters {filters}")
+        samples = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            count = scraper.scrape_fake_jobs_to_csv(
+                Path(tmp) / "out.csv", parser=args.parser, workers=args.workers, from_files=pages, **filters,
+            )
+            samples.append(time.perf_counter() - t0)
+        _report(f"{count} rows", samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="scraper.py benchmarks")
+    sub = parser.add_subparsers(dest="name", required=True)
+
+    bp = sub.add_parser("pool", help="Pooled session vs per-request connections")
+    bp.add_argument("--requests", type=int, default=500)
+    bp.add_argument("--pool-size", type=int, default=scraper.POOL_SIZE)
+    bp.set_defaults(func=bench_pool)
+
+    bparse = sub.add_parser("parse", help="Card extraction backends on a synthetic page")
+    bparse.add_argument("--cards", type=int, default=50_000)
+    bparse.set_defaults(func=bench_parse)
+
+    btop = sub.add_parser("topk", help="Heap top-k vs full sort for --sort with --limit")
+    btop.add_argument("--rows", type=int, default=1_000_000)
+    btop.add_argument("--limit", type=int, default=25)
+    btop.add_argument("--sort", choices=sorted(scraper._SORT_COLUMNS), default="title")
+    btop.set_defaults(func=bench_topk)
+
+    bdate = sub.add_parser("dates", help="Memoized _parse_date vs the per-row strptime loop")
+    bdate.add_argument("--rows", type=int, default=1_000_000)
+    bdate.add_argument("--format", default="%Y-%m-%d", help='strftime format for the dates, e.g. "%%b %%d, %%Y"')
+    bdate.set_defaults(func=bench_dates)
+
+    bkw = sub.add_parser("keywords", help="Compiled include/exclude matcher vs per-row lowering")
+    bkw.add_argument("--rows", type=int, default=500_000)
+    bkw.add_argument("--include", type=int, default=1, help="Number of include terms (max 7)")
+    bkw.add_argument("--exclude", type=int, default=24, help="Number of exclude terms")
+    bkw.set_defaults(func=bench_keywords)
+
+    bmem = sub.add_parser("memory", help="Memory per row of tuples and JobTable")
+    bmem.add_argument("--rows", type=int, default=1_000_000)
+    bmem.set_defaults(func=bench_memory)
+
+    bwrite = sub.add_parser("write", help="CSV write throughput, per-row vs bulk")
+    bwrite.add_argument("--rows", type=int, default=1_000_000)
+    bwrite.add_argument("--dir", default=None, help="Directory to write in (e.g. a network mount)")
+    bwrite.set_defaults(func=bench_write)
+
+    bcomp = sub.add_parser("compress", help="Compressed CSV output: throughput vs ratio")
+    bcomp.add_argument("--rows", type=int, default=1_000_000)
+    bcomp.add_argument("--levels", type=int, nargs="+", default=[1, 6])
+    bcomp.add_argument("--dir", default=None)
+    bcomp.set_defaults(func=bench_compress)
+
+    bwork = sub.add_parser("workers", help="Multi-process page parsing over a local corpus")
+    bwork.add_argument("--pages", type=int, default=64)
+    bwork.add_argument("--cards", type=int, default=2_000, help="Cards per synthetic page")
+    bwork.add_argument("--corpus", default=None, help="Directory of saved *.html pages to parse instead")
+    bwork.add_argument("--parser", choices=scraper.PARSERS, default="html.parser")
+    bwork.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    bwork.set_defaults(func=bench_workers)
+
+    bpipe = sub.add_parser("pipeline", help="Offline fakejobs run over saved pages (parse + filter + write)")
+    bpipe.add_argument("--pages", type=int, default=16)
+    bpipe.add_argument("--cards", type=int, default=1_000, help="Cards per synthetic page")
+    bpipe.add_argument("--corpus", default=None, help="Directory of saved *.html pages to use instead")
+    bpipe.add_argument("--parser", choices=scraper.PARSERS, default="html.parser")
+    bpipe.add_argument("--workers", type=int, default=1)
+    bpipe.add_argument("--repeat", type=int, default=3)
+    bpipe.add_argument("--include", nargs="*", default=None)
+    bpipe.add_argument("--since", default=None)
+    bpipe.add_argument("--dedupe", action="store_true")
+    bpipe.add_argument("--sort", choices=sorted(scraper._SORT_COLUMNS), default=None)
+    bpipe.add_argument("--limit", type=int, default=None)
+    bpipe.set_defaults(func=bench_pipeline)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,72 @@
-from datetime import datetime
-from typing import List, Tuple, Iterable
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from html import escape as html_escape
+from html.parser import HTMLParser
+from itertools import islice, repeat
+from typing import List, Tuple, Iterable, Iterator
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 
-import argparse, csv, sys, textwrap
+import argparse, asyncio, csv, gzip, hashlib, heapq, io, json, lzma, math, mmap, os, pickle, re, struct, sys, tempfile, textwrap, threading
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+try:  # optional .zst output
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:  # optional .parquet output
+    import pyarrow
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:
+    pyarrow = pyarrow_parquet = None
+
+try:  # optional faster parser backend
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_html = lxml_etree = None
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 }
 TIMEOUT = 30
+POOL_SIZE = 10  # keep-alive connections kept per host
+
+FAKE_JOBS_URL = "https://realpython.github.io/fake-jobs/"
+CACHE_DIR = ".http_cache"
+CACHE_MAX_MB = 64
+CSV_HEADER = ["Job Title", "Company", "Location", "Date Posted"]
+SNAPSHOT_VERSION = 2
+PARSERS = ("html.parser", "lxml", "stream")
+STREAM_CHUNK = 64 * 1024
+DATE_CACHE_SIZE = 4096  # distinct raw date strings remembered by _parse_date
+INDEX_VERSION = 1
+STATE_VERSION = 1
+WRITE_BUFFER = 1024 * 1024  # bytes buffered by the CSV file object
+WRITE_BATCH = 4096  # rows handed to csv.writerows at once
+CRAWL_DELAY = 0.25  # default politeness gap (seconds) between requests to one host
+CRAWL_BATCH = 4  # frontier URLs fetched per round, per unit of --concurrency
+FRONTIER_MAX = 10_000  # queued crawl URLs kept in memory before spilling to disk
+VISITED_MEMORY_MB = 16  # in-memory budget for the crawl's visited-URL digests
+DETAIL_CONCURRENCY = 8  # detail pages fetched at once by --with-details
+DETAILS_HEADER = CSV_HEADER + ["Description"]
+SEARCH_LIMIT = 20  # default number of ranked search results
+SEED_CSV = Path(__file__).with_name("testdata") / "seed_jobs.csv"  # postings cycled by synthetic_rows(); never written
+ROW_GROUP_SIZE = 65536  # rows per row group in columnar output
+COLUMNAR_MAGIC = b"JOBCOL1\n"
+DEDUPE_DIGEST_SIZE = 16  # bytes per hashed dedupe key (128-bit blake2b)
+DEDUPE_MEMORY_MB = 64  # default budget for --dedupe-approx
+
+_SESSION: requests.Session | None = None
 
 ASCII = r"""
 __        __   _                                        
@@ -36,33 +91,266 @@ def welcome_and_purpose():
     ))
     print()
     
+def configure_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """(Re)build the shared session with a keep-alive pool of `pool_size` connections."""
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    _SESSION = session
+    return session
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it with the default pool on first use."""
+    return _SESSION if _SESSION is not None else configure_session()
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """GET through the pooled session with the default timeout; raises on HTTP errors."""
+    kwargs.setdefault("timeout", TIMEOUT)
+    resp = get_session().get(url, **kwargs)
+    resp.raise_for_status()
+    return resp
+
+class HttpCache:
+    """
+    On-disk page cache keyed by URL.
+
+    Bodies are stored with their ETag / Last-Modified validators; later
+    fetches send If-None-Match / If-Modified-Since and a 304 is served from
+    disk. The size of the stored bodies is tracked in memory (one directory
+    scan per run); once it exceeds `max_bytes`, least recently used entries
+    are evicted down to EVICT_TO of the budget. Safe to share between the
+    fetch threads.
+    """
+
+    EVICT_TO = 0.9  # fraction of max_bytes left after an eviction pass
+
+    def __init__(self, root: Path, max_bytes: int = CACHE_MAX_MB * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._total: int | None = None  # bytes of stored bodies, None until first scanned
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / f"{key}.body", self.root / f"{key}.json"
+
+    def fetch(self, url: str) -> str:
+        """Return the page text, revalidating any cached copy with a conditional GET."""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = None
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        resp = _get(url, headers=headers)
+        if resp.status_code == 304 and meta:
+            try:
+                body = body_path.read_bytes()
+                os.utime(meta_path)  # mark as recently used
+            except FileNotFoundError:  # evicted meanwhile: treat as a miss
+                resp = _get(url)
+            else:
+                return body.decode(meta["encoding"], errors="replace")
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._store(body_path, meta_path, {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": resp.encoding or "utf-8",
+            }, resp.content)
+        return resp.text
+
+    def _write_atomic(self, path: Path, data: bytes):
+        with tempfile.NamedTemporaryFile(dir=self.root, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+
+    def _store(self, body_path: Path, meta_path: Path, meta: dict, body: bytes):
+        try:
+            replaced = body_path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+        with self._lock:
+            if self._total is None:
+                self._total = self._entries()[1]
+            else:
+                self._total += len(body) - replaced
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> Tuple[list, int]:
+        """(mtime, size, meta path, body path) of every stored page, and their total size."""
+        entries = []
+        total = 0
+        for meta_path in self.root.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                size = body_path.stat().st_size
+                entries.append((meta_path.stat().st_mtime, size, meta_path, body_path))
+            except FileNotFoundError:
+                continue
+            total += size
+        return entries, total
+
+    def _evict(self):
+        entries, total = self._entries()
+        entries.sort()
+        target = self.max_bytes * self.EVICT_TO
+        for _, size, meta_path, body_path in entries:
+            if total <= target:
+                break
+            meta_path.unlink(missing_ok=True)
+            body_path.unlink(missing_ok=True)
+            total -= size
+        self._total = total
+
+def _fetch_text(url: str, cache: HttpCache | None = None) -> str:
+    return cache.fetch(url) if cache is not None else _get(url).text
+
+class _HostRateLimiter:
+    """Spaces request starts so each host sees at most `rate` requests/second."""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot: dict[str, float] = {}
+
+    async def wait(self, host: str):
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+async def _fetch_all_async(
+    urls: List[str],
+    concurrency: int,
+    rate: float | None,
+    cache: HttpCache | None,
+    fetch_text=_fetch_text,
+    limiter: _HostRateLimiter | None = None,
+) -> List[str]:
+    """
+    Fetch `urls` with at most `concurrency` in flight; bodies come back in
+    input order. Pass a `limiter` to keep per-host spacing across calls.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    limiter = limiter or _HostRateLimiter(rate)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        async def fetch(url: str) -> str:
+            async with sem:
+                await limiter.wait(urlsplit(url).netloc)
+                return await loop.run_in_executor(pool, fetch_text, url, cache)
+
+        return await asyncio.gather(*(fetch(u) for u in urls))
+
+def fetch_pages(
+    urls: List[str],
+    concurrency: int = 1,
+    rate: float | None = None,
+    cache: HttpCache | None = None,
+) -> List[str]:
+    """
+    Fetch every URL and return the page bodies in the same order.
+
+    concurrency > 1 (or a per-host `rate` limit in requests/second) runs the
+    asyncio engine on top of the pooled session; otherwise pages are fetched
+    one after another. Pages go through `cache` when one is given.
+    """
+    if concurrency <= 1 and not rate:
+        return [_fetch_text(u, cache) for u in urls]
+    return asyncio.run(_fetch_all_async(urls, max(1, concurrency), rate, cache))
+
 def _txt(el) -> str:
     return el.get_text(strip=True) if el else ""
 
+_DATE_FORMATS = ["%Y-%m-%d", "%b %d, %Y", "%B %d, %Y"]
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
 def _parse_date(s: str) -> datetime | None:
-    """Best-effort date parser; extend formats as needed."""
-    for fmt in ("%Y-%m-%d", "%b %d, %Y", "%B %d, %Y"):
+    """
+    Best-effort date parser; extend formats as needed.
+
+    Results are memoized per raw string, zero-padded ISO dates skip
+    strptime entirely, and the format that last succeeded is tried first.
+    """
+    if (len(s) == 10 and s[4] == "-" and s[7] == "-" and s.isascii()
+            and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit()):
+        try:
+            return datetime(int(s[:4]), int(s[5:7]), int(s[8:]))
+        except ValueError:
+            return None
+    for i, fmt in enumerate(_DATE_FORMATS):
         try:
-            return datetime.strptime(s, fmt)
+            d = datetime.strptime(s, fmt)
         except ValueError:
             continue
+        if i:
+            _DATE_FORMATS.insert(0, _DATE_FORMATS.pop(i))
+        return d
     return None
 
+class _KeywordMatcher:
+    """
+    --include/--exclude terms compiled once: every include term must appear
+    and no exclude term may appear, case-insensitively. Includes are
+    pre-lowered and deduplicated; excludes become one alternation regex,
+    so a row is scanned once however many exclude terms there are.
+    """
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = ()):
+        self.include = tuple(dict.fromkeys(t.lower() for t in include))
+        exclude = list(dict.fromkeys(t.lower() for t in exclude))
+        self._exclude = (
+            re.compile("|".join(map(re.escape, exclude))).search if exclude else None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self._exclude)
+
+    def matches(self, blob: str) -> bool:
+        """`blob` must already be lowercase."""
+        if self.include and not all(map(blob.__contains__, self.include)):
+            return False
+        return not (self._exclude and self._exclude(blob))
+
 def _passes_filters(
-    row: Tuple[str, str, str, str],
-    include: Iterable[str],
-    exclude: Iterable[str],
-    location: str | None,
+    row: Tuple[str, int, int, str],
+    matcher: _KeywordMatcher,
+    location_ok,
     since: datetime | None,
+    companies: "_ColumnCodes",
+    locations: "_ColumnCodes",
 ) -> bool:
-    title, company, loc, date_str = row
-    blob = f"{title} {company} {loc}".lower()
+    """`row` is dictionary-encoded: (title, company code, location code, date)."""
+    title, c, l, date_str = row
 
-    if include and not all(term.lower() in blob for term in include):
-        return False
-    if exclude and any(term.lower() in blob for term in exclude):
+    if matcher and not matcher.matches(f"{title.lower()} {companies.lower[c]} {locations.lower[l]}"):
         return False
-    if location and location.lower() not in loc.lower():
+    if location_ok is not None and not location_ok(l):
         return False
     if since is not None:
         d = _parse_date(date_str)
@@ -70,17 +358,29 @@ def _passes_filters(
             return False
     return True
 
+def _split_location(loc: str) -> Tuple[str, str]:
+    """"Stewartbury, AA" -> ("stewartbury", "aa"); no comma means no state."""
+    city, _, state = loc.lower().rpartition(",")
+    if not city:
+        return state.strip(), ""
+    return city.strip(), state.strip()
+
+def _location_matches(loc: str, state: str | None, prefix: str | None) -> bool:
+    """`state` and `prefix` are expected lowercased once by the caller."""
+    if state is not None and _split_location(loc)[1] != state:
+        return False
+    return prefix is None or loc.lower().startswith(prefix)
+
     
-def scrape_xula_mission():
-    """Fetch and return XULA's mission statement text."""
+def scrape_xula_mission(from_file: Path | None = None):
+    """Fetch (or read a saved copy of) XULA's mission page and return the statement text."""
     URL = "https://www.xula.edu/about/mission-values.html"
-    response = requests.get(URL, headers=HEADERS, timeout=TIMEOUT)
-    response.raise_for_status()  # raises an error if request fails
-    soup = BeautifulSoup(response.content, 'html.parser')
+    content = from_file.read_bytes() if from_file else _get(URL).content  # raises an error if request fails
+    soup = BeautifulSoup(content, 'html.parser')
     
     container = soup.find("div", class_="editorarea")
     if not container:
-        return "Mission statement not found."
+        return _saved_mission(soup, "xula-mission")
 
     # Prefer a paragraph that includes the hint substring if present.
     for p in container.find_all("p"):
@@ -90,18 +390,1120 @@ def scrape_xula_mission():
 
     return _txt(container)
     
-def scrape_morehouse_mission():
-    """Fetch and return Morehouse College's mission statement text."""
+def scrape_morehouse_mission(from_file: Path | None = None):
+    """Fetch (or read a saved copy of) Morehouse College's mission page and return the statement text."""
     URL = "https://morehouse.edu/about/mission-and-values"
-    response = requests.get(URL, headers=HEADERS, timeout=TIMEOUT)
-    response.raise_for_status()  # raise error if request fails
-    soup = BeautifulSoup(response.content, 'html.parser')
+    content = from_file.read_bytes() if from_file else _get(URL).content  # raise error if request fails
+    soup = BeautifulSoup(content, 'html.parser')
     
     paras = soup.select("p.paragraph")
     if paras:
         return " ".join(_txt(p) for p in paras if _txt(p))
-    return "Mission statement not found."
+    return _saved_mission(soup, "morehouse-mission")
+
+def _saved_mission(soup: BeautifulSoup, quote_id: str) -> str:
+    """The pages in web/ keep each mission statement in a <blockquote id=...>."""
+    quote = soup.find("blockquote", id=quote_id)
+    if quote is None:
+        return "Mission statement not found."
+    return " ".join(quote.get_text().split())
     
+def _extract_cards_bs4(html: str) -> List[Tuple[str, str, str, str]]:
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for c in soup.select("div.card-content"):
+        title = _txt(c.select_one("h2.title"))
+        company = _txt(c.select_one("h3.subtitle"))
+        loc = _txt(c.select_one("p.location"))
+        date_posted = _txt(c.select_one("time"))
+        rows.append((title, company, loc, date_posted))
+    return rows
+
+def _has_class(cls: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+_LXML_PARSER = _LXML_CARD = _LXML_FIELDS = None
+if lxml_etree is not None:  # compiled once; evaluating a compiled XPath is much cheaper
+    _LXML_PARSER = lxml_html.HTMLParser(encoding="utf-8")  # ignore any charset the page declares
+    _LXML_CARD = lxml_etree.XPath(f"//div[{_has_class('card-content')}]")
+    _LXML_FIELDS = tuple(lxml_etree.XPath(p) for p in (
+        f"(.//h2[{_has_class('title')}])[1]",
+        f"(.//h3[{_has_class('subtitle')}])[1]",
+        f"(.//p[{_has_class('location')}])[1]",
+        "(.//time)[1]",
+    ))
+
+def _extract_cards_lxml(html: str) -> List[Tuple[str, str, str, str]]:
+    if lxml_html is None:
+        raise ValueError("--parser lxml needs the lxml package (pip install lxml).")
+    try:
+        # bytes, so pages carrying an <?xml encoding=...?> declaration parse too
+        root = lxml_html.fromstring(html.encode("utf-8"), parser=_LXML_PARSER)
+    except lxml_etree.ParserError:  # empty, whitespace- or comment-only page
+        return []
+    rows = []
+    for c in _LXML_CARD(root):
+        fields = []
+        for path in _LXML_FIELDS:
+            found = path(c)
+            # same text as _txt(): stripped pieces joined without a separator
+            fields.append("".join(t.strip() for t in found[0].itertext()) if found else "")
+        rows.append(tuple(fields))
+    return rows
+
+class _CardStreamParser(HTMLParser):
+    """
+    SAX-style card extractor: reacts to tag events and keeps only the text
+    of the four fields, never a document tree. Finished cards collect in
+    `rows` as soon as their div.card-content closes.
+    """
+
+    # tag -> (required class or None, field index); first match per card wins
+    _FIELDS = {"h2": ("title", 0), "h3": ("subtitle", 1), "p": ("location", 2), "time": (None, 3)}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[Tuple[str, str, str, str]] = []
+        self._card_depth = 0  # open <div>s inside the current card, 0 = outside
+        self._fields: list = []
+        self._capture: str | None = None  # tag whose text is being collected
+        self._capture_idx = 0
+        self._capture_nest = 0
+        self._buf: List[str] = []
+        self._node: List[str] = []  # raw pieces of the current text node
+
+    def _end_text_node(self):
+        # like get_text(strip=True): strip whole text nodes, which a chunked
+        # feed can deliver in several handle_data calls
+        if self._node:
+            text = "".join(self._node).strip()
+            if text:
+                self._buf.append(text)
+            self._node = []
+
+    @staticmethod
+    def _classes(attrs) -> List[str]:
+        for name, value in attrs:
+            if name == "class" and value:
+                return value.split()
+        return []
+
+    def handle_starttag(self, tag, attrs):
+        self._end_text_node()
+        if not self._card_depth:
+            if tag == "div" and "card-content" in self._classes(attrs):
+                self._card_depth = 1
+                self._fields = [None, None, None, None]
+            return
+        if tag == "div":
+            self._card_depth += 1
+        if self._capture is not None:
+            if tag == self._capture:
+                self._capture_nest += 1
+            return
+        spec = self._FIELDS.get(tag)
+        if spec and self._fields[spec[1]] is None and (
+            spec[0] is None or spec[0] in self._classes(attrs)
+        ):
+            self._capture, self._capture_idx, self._capture_nest = tag, spec[1], 1
+            self._buf = []
+
+    def handle_endtag(self, tag):
+        self._end_text_node()
+        if not self._card_depth:
+            return
+        if tag == self._capture:
+            self._capture_nest -= 1
+            if not self._capture_nest:
+                self._fields[self._capture_idx] = "".join(self._buf)
+                self._capture = None
+        if tag == "div":
+            self._card_depth -= 1
+            if not self._card_depth:
+                self.rows.append(tuple(f or "" for f in self._fields))
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._node.append(data)
+
+    def handle_comment(self, data):
+        self._end_text_node()
+
+def _extract_cards_stream(html: str) -> List[Tuple[str, str, str, str]]:
+    p = _CardStreamParser()
+    p.feed(html)
+    p.close()
+    return p.rows
+
+def _stream_cards(chunks: Iterable[str]) -> Iterator[Tuple[str, str, str, str]]:
+    """Feed HTML text chunks to the stream parser, yielding each card as soon as it closes."""
+    p = _CardStreamParser()
+    for chunk in chunks:
+        p.feed(chunk)
+        if p.rows:
+            done, p.rows = p.rows, []
+            yield from done
+    p.close()
+    yield from p.rows
+
+def _extract_cards_linked(html: str, base_url: str) -> List[Tuple[str, str, str, str, str]]:
+    """
+    Like _extract_cards_bs4(), plus a fifth field: the card's absolute
+    "Apply" (detail page) URL, or "" when it has none. The link sits in the
+    card footer, outside div.card-content, so the enclosing div.card is
+    searched.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
+    for c in soup.select("div.card-content"):
+        card = c.find_parent("div", class_="card") or c
+        href = next((a.get("href", "") for a in card.find_all("a") if _txt(a).lower() == "apply"), "")
+        rows.append((
+            _txt(c.select_one("h2.title")),
+            _txt(c.select_one("h3.subtitle")),
+            _txt(c.select_one("p.location")),
+            _txt(c.select_one("time")),
+            urljoin(base_url, href) if href else "",
+        ))
+    return rows
+
+_EXTRACTORS = {
+    "html.parser": _extract_cards_bs4,
+    "lxml": _extract_cards_lxml,
+    "stream": _extract_cards_stream,
+}
+
+def _extract_cards(
+    html: str, parser: str = "html.parser", base_url: str | None = None
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Pull (title, company, location, date) out of every job card on a listing
+    page. With the page's `base_url`, rows also carry the card's detail URL
+    (read with html.parser whatever `parser` says).
+    """
+    if parser not in _EXTRACTORS:
+        raise ValueError(f"Invalid --parser. Choose: {', '.join(PARSERS)}")
+    if base_url is not None:
+        return _extract_cards_linked(html, base_url)
+    return _EXTRACTORS[parser](html)
+
+def parse_pages(
+    pages: List[str],
+    parser: str = "html.parser",
+    workers: int = 1,
+    base_urls: List[str] | None = None,
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Extract the cards of every page, in page order. workers > 1 spreads the
+    pages over a process pool so parsing isn't held to one core by the GIL;
+    each worker sends back only its page's row tuples. `base_urls` (one per
+    page) adds each card's detail URL to its row.
+    """
+    base_urls = base_urls or [None] * len(pages)
+    rows: List[Tuple[str, str, str, str]] = []
+    if workers <= 1 or len(pages) <= 1:
+        for html, base_url in zip(pages, base_urls):
+            rows.extend(_extract_cards(html, parser, base_url))
+        return rows
+    workers = min(workers, len(pages))
+    chunksize = max(1, len(pages) // (workers * 4))
+    with ProcessPoolExecutor(workers) as pool:
+        for batch in pool.map(_extract_cards, pages, repeat(parser), base_urls, chunksize=chunksize):
+            rows.extend(batch)
+    return rows
+
+def scrape_fake_jobs(
+    urls: List[str] | None = None,
+    concurrency: int = 1,
+    rate: float | None = None,
+    cache: HttpCache | None = None,
+    parser: str = "html.parser",
+    workers: int = 1,
+    links: bool = False,
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Fetch the listing page(s) and return every card as a (title, company,
+    location, date) row; `links` appends each card's detail URL.
+    """
+    urls = urls or [FAKE_JOBS_URL]
+    pages = fetch_pages(urls, concurrency, rate, cache)
+    return parse_pages(pages, parser, workers, urls if links else None)
+
+def stream_fake_jobs(urls: List[str] | None = None) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Like scrape_fake_jobs(), but reads each response incrementally and
+    yields rows while the page is still downloading; memory stays flat
+    regardless of page size. Pages are fetched one at a time, uncached.
+    """
+    for url in urls or [FAKE_JOBS_URL]:
+        with _get(url, stream=True) as resp:
+            resp.encoding = resp.encoding or "utf-8"
+            yield from _stream_cards(resp.iter_content(STREAM_CHUNK, decode_unicode=True))
+
+def saved_pages(paths: Iterable[Path]) -> List[Path]:
+    """Expand --from-file/--from-dir paths; a directory contributes its *.html/*.htm files, sorted."""
+    files: List[Path] = []
+    for p in paths:
+        if p.is_dir():
+            found = sorted(f for f in p.iterdir() if f.suffix.lower() in (".html", ".htm"))
+            if not found:
+                raise ValueError(f"No saved .html pages in {p}.")
+            files.extend(found)
+        else:
+            files.append(p)
+    return files
+
+def load_fake_jobs(
+    paths: List[Path],
+    parser: str = "html.parser",
+    workers: int = 1,
+    stream: bool = False,
+) -> Iterable[Tuple[str, str, str, str]]:
+    """
+    Offline replay: rows from saved listing pages (files, or directories of
+    them), through the same card extraction as live scraping. `stream`
+    feeds each file to the stream parser in STREAM_CHUNK pieces instead of
+    reading it whole.
+    """
+    paths = saved_pages(paths)
+    if stream:
+        return _stream_saved_pages(paths)
+    return parse_pages([p.read_text(encoding="utf-8") for p in paths], parser, workers)
+
+def _stream_saved_pages(paths: List[Path]) -> Iterator[Tuple[str, str, str, str]]:
+    for p in paths:
+        with p.open(encoding="utf-8") as f:
+            yield from _stream_cards(iter(lambda: f.read(STREAM_CHUNK), ""))
+
+_SYNTHETIC_CARD = """<div class="column is-half">
+<div class="card">
+<div class="card-content">
+<div class="media">
+<div class="media-left">
+<figure class="image is-48x48"><img src="https://files.realpython.com/media/real-python-logo-thumbnail.7f0db70c2ed2.jpg" alt="Real Python Logo"></figure>
+</div>
+<div class="media-content">
+<h2 class="title is-5">{title}</h2>
+<h3 class="subtitle is-6 company">{company}</h3>
+</div>
+</div>
+<div class="content">
+<p class="location">
+        {location}
+      </p>
+<p class="is-small has-text-grey">
+<time datetime="{date}">{date}</time>
+</p>
+</div>
+</div>
+<footer class="card-footer">
+<a href="https://www.realpython.com" target="_blank" class="card-footer-item">Learn</a>
+<a href="https://realpython.github.io/fake-jobs/jobs/job-{n}.html" target="_blank" class="card-footer-item">Apply</a>
+</footer>
+</div>
+</div>
+"""
+
+def synthetic_rows(n: int, start: int = 0) -> List[Tuple[str, str, str, str]]:
+    """
+    Rows start..start+n-1 of an endless, deterministic stream of postings
+    cycled from testdata/seed_jobs.csv (a saved copy of the real board).
+    Copies past the first pass get a numbered title and a date spread over
+    two years so sorts have work to do.
+    """
+    with SEED_CSV.open(newline="", encoding="utf-8") as f:
+        base = [tuple(r[:4]) for r in list(csv.reader(f))[1:] if len(r) >= 4]
+    if not base:
+        raise ValueError(f"{SEED_CSV} has no postings to build synthetic rows from.")
+    newest = date(2021, 4, 8)
+    rows = []
+    for i in range(start, start + n):
+        if i < len(base):
+            rows.append(base[i])
+            continue
+        t, c, l, _ = base[i % len(base)]
+        d = newest - timedelta(days=(i * 7919) % 730)
+        rows.append((f"{t} {i // len(base)}", c, l, d.isoformat()))
+    return rows
+
+def synthetic_page(n: int, start: int = 0) -> str:
+    """A fake-jobs listing page in the real site's markup, holding synthetic_rows(n, start)."""
+    cards = "".join(
+        _SYNTHETIC_CARD.format(n=i, **{k: html_escape(v) for k, v in zip(("title", "company", "location", "date"), r)})
+        for i, r in enumerate(synthetic_rows(n, start), start)
+    )
+    return f'<html><body><section class="section"><div class="columns is-multiline">{cards}</div></section></body></html>'
+
+def write_synthetic_pages(out_dir: Path, pages: int, cards: int) -> int:
+    """Save `pages` synthetic listing pages of `cards` cards each (distinct postings) for --from-dir."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(pages):
+        (out_dir / f"page{i:04d}.html").write_text(synthetic_page(cards, i * cards), encoding="utf-8")
+    return pages * cards
+
+def _fetch_text_or_none(url: str, cache: HttpCache | None = None) -> str | None:
+    """_fetch_text() for crawling: a dead link is reported and skipped instead of ending the crawl."""
+    try:
+        return _fetch_text(url, cache)
+    except requests.RequestException as e:
+        print(f"Skipping {url}: {e}", file=sys.stderr)
+        return None
+
+def _normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for the crawl's visited set: lowercase scheme
+    and host, default port and fragment dropped, "/" for an empty path and
+    query parameters sorted.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+class _LinkParser(HTMLParser):
+    """Collects the pagination links a crawl follows (rel="next" or Bulma .pagination-* links)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.pages: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in ("a", "link"):
+            return
+        a = dict(attrs)
+        href = (a.get("href") or "").strip()
+        if href and ("next" in (a.get("rel") or "").lower().split() or "pagination" in (a.get("class") or "")):
+            self.pages.append(href)
+
+class _Frontier:
+    """
+    FIFO crawl queue of (depth, url). Up to `max_items` entries stay in a
+    deque; beyond that new entries go to a temp file (keeping FIFO order)
+    and are read back as the deque drains.
+    """
+
+    def __init__(self, max_items: int = FRONTIER_MAX):
+        self.max_items = max_items
+        self._mem: deque = deque()
+        self._spill = None
+        self._read_pos = 0
+        self._spilled = 0
+
+    def push(self, depth: int, url: str):
+        if not self._spilled and len(self._mem) < self.max_items:
+            self._mem.append((depth, url))
+            return
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="frontier-")
+        self._spill.seek(0, os.SEEK_END)
+        self._spill.write(f"{depth}\t{url}\n".encode("utf-8"))
+        self._spilled += 1
+
+    def pop_batch(self, n: int) -> List[Tuple[int, str]]:
+        batch: List[Tuple[int, str]] = []
+        while len(batch) < n:
+            if not self._mem:
+                self._refill()
+                if not self._mem:
+                    break
+            batch.append(self._mem.popleft())
+        return batch
+
+    def _refill(self):
+        if not self._spilled:
+            return
+        self._spill.seek(self._read_pos)
+        while self._spilled and len(self._mem) < self.max_items:
+            depth, url = self._spill.readline().decode("utf-8").rstrip("\n").split("\t", 1)
+            self._mem.append((int(depth), url))
+            self._spilled -= 1
+        self._read_pos = self._spill.tell()
+        if not self._spilled:
+            self._spill.truncate(0)
+            self._read_pos = 0
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+def _polite_rate(rate: float | None, delay: float | None) -> float | None:
+    """Per-host requests/second honoring both a --rate cap and a --crawl-delay gap."""
+    interval = max(delay or 0.0, 1.0 / rate if rate else 0.0)
+    return 1.0 / interval if interval else None
+
+def crawl_fake_jobs(
+    urls: List[str] | None = None,
+    max_depth: int = 1,
+    concurrency: int = 1,
+    rate: float | None = None,
+    cache: HttpCache | None = None,
+    parser: str = "html.parser",
+    delay: float | None = CRAWL_DELAY,
+    max_pages: int | None = None,
+    links: bool = False,
+) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Crawl outward from the listing page(s) and yield card rows as pages
+    arrive. Pagination links on the start hosts are followed up to
+    `max_depth` hops, in rounds of concurrent fetches with
+    at least `delay` seconds (and at most `rate` requests/second) between
+    requests to one host. Memory stays bounded however large the site:
+    the frontier spills to disk, visited URLs are kept as 128-bit digests
+    of their normalized form (spilling too), and only one round of pages
+    is held at a time. `max_pages` caps the number of fetches.
+
+    Detail pages are not crawled: they hold no cards. `links` appends each
+    card's detail URL to its row instead, so with_details() fetches only
+    the pages of rows that survive the filters, once each.
+    """
+    start = [_normalize_url(u) for u in urls or [FAKE_JOBS_URL]]
+    hosts = {urlsplit(u).netloc for u in start}
+    limiter = _HostRateLimiter(_polite_rate(rate, delay))
+    concurrency = max(1, concurrency)
+    frontier = _Frontier()
+    visited = _HashedKeySet(VISITED_MEMORY_MB * 1024 * 1024)
+
+    def enqueue(depth: int, url: str):
+        if urlsplit(url).netloc in hosts:
+            digest = hashlib.blake2b(url.encode("utf-8"), digest_size=DEDUPE_DIGEST_SIZE).digest()
+            if visited.add(digest):
+                frontier.push(depth, url)
+
+    try:
+        for u in start:
+            enqueue(0, u)
+        fetched = 0
+        while max_pages is None or fetched < max_pages:
+            n = concurrency * CRAWL_BATCH
+            batch = frontier.pop_batch(n if max_pages is None else min(n, max_pages - fetched))
+            if not batch:
+                break
+            fetched += len(batch)
+            pages = asyncio.run(_fetch_all_async(
+                [u for _, u in batch], concurrency, None, cache, _fetch_text_or_none, limiter,
+            ))
+            for (depth, url), html in zip(batch, pages):
+                if html is None:
+                    continue
+                yield from _extract_cards(html, parser, url if links else None)
+                if depth >= max_depth:
+                    continue
+                found = _LinkParser()
+                found.feed(html)
+                found.close()
+                for href in found.pages:
+                    target = urljoin(url, href)
+                    if urlsplit(target).scheme in ("http", "https"):
+                        enqueue(depth + 1, _normalize_url(target))
+    finally:
+        visited.close()
+        frontier.close()
+
+def _detail_description(html: str) -> str:
+    """Description text of a job detail page: its div.content paragraphs, minus the location/date lines."""
+    content = BeautifulSoup(html, "html.parser").select_one("div.content")
+    if content is None:
+        return ""
+    paragraphs = [_txt(p) for p in content.find_all("p") if not p.get("id")]
+    return " ".join(p for p in paragraphs if p)
+
+def with_details(
+    rows: Iterable[tuple],
+    concurrency: int = DETAIL_CONCURRENCY,
+    rate: float | None = None,
+    cache: HttpCache | None = None,
+) -> Iterator[Tuple[str, str, str, str, str]]:
+    """
+    Turn (title, company, location, date, detail URL) rows into (title,
+    company, location, date, description), fetching detail pages
+    `concurrency` at a time through the async engine (and `cache`, so
+    unchanged pages are only revalidated). Rows are yielded in input order
+    as each window of fetches completes, so output starts long before the
+    last page arrives. A missing or dead detail link gives "".
+    """
+    concurrency = max(1, concurrency)
+    limiter = _HostRateLimiter(rate)
+    rows = iter(rows)
+    while batch := list(islice(rows, concurrency * CRAWL_BATCH)):
+        urls = [r[4] for r in batch if r[4]]
+        pages = iter(asyncio.run(_fetch_all_async(
+            urls, concurrency, None, cache, _fetch_text_or_none, limiter,
+        )) if urls else ())
+        for r in batch:
+            html = next(pages) if r[4] else None
+            yield (r[0], r[1], r[2], r[3], _detail_description(html) if html else "")
+
+def _parse_since(since_str: str) -> datetime:
+    try:
+        return datetime.strptime(since_str, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError("Invalid --since format. Use YYYY-MM-DD.")
+
+def filter_rows(
+    rows: Iterable[Tuple[str, str, str, str]],
+    include: List[str] | None = None,
+    exclude: List[str] | None = None,
+    location: str | None = None,
+    since_str: str | None = None,
+    dedupe: bool = False,
+    sort_by: str | None = None,  # 'date' | 'title' | 'company' | 'location'
+    limit: int | None = None,
+    state: str | None = None,
+    location_prefix: str | None = None,
+    dedupe_memory_mb: float | None = None,
+    dedupe_approx: bool = False,
+    keep_extra: bool = False,
+) -> Iterable[Tuple[str, str, str, str]]:
+    """
+    Apply the include/exclude/location/state/since -> dedupe -> sort -> limit pipeline.
+    `keep_extra` passes fields past the fourth (e.g. detail URLs) through.
+
+    Every stage is a generator, so rows flow through one at a time: without
+    --sort, a --limit stops pulling rows (and downloading) once N rows are
+    out. --sort with --limit keeps only the best N rows in a heap instead
+    of sorting everything; plain --sort still needs all rows in memory.
+    """
+    # Validate options before any rows are pulled
+    since_dt = _parse_since(since_str) if since_str else None
+    if sort_by and sort_by not in _SORT_COLUMNS:
+        raise ValueError("Invalid --sort. Choose: date, title, company, location")
+    if (dedupe_memory_mb is not None or dedupe_approx) and not dedupe:
+        raise ValueError("--dedupe-memory and --dedupe-approx only apply with --dedupe.")
+    if dedupe_memory_mb is not None and not dedupe_memory_mb > 0:
+        raise ValueError("--dedupe-memory must be a positive number of MB.")
+    if not (isinstance(limit, int) and limit > 0):
+        limit = None
+
+    # Company/location are dictionary-encoded up front: filters, dedupe
+    # and sort keys work on integer codes and per-code lowercase forms,
+    # and strings are decoded again only as rows leave the pipeline.
+    if isinstance(rows, JobTable):
+        companies, locations = _ColumnCodes(rows.companies), _ColumnCodes(rows.locations)
+    else:
+        companies, locations = _ColumnCodes(), _ColumnCodes()
+    rows = _encode_rows(rows, companies, locations, keep_extra)
+
+    # Filters
+    matcher = _KeywordMatcher(include or [], exclude or [])
+    location_ok = _location_filter(locations, location, state, location_prefix)
+    if keep_extra:
+        rows = (r for r in rows if _passes_filters(r[:4], matcher, location_ok, since_dt, companies, locations))
+    else:
+        rows = (r for r in rows if _passes_filters(r, matcher, location_ok, since_dt, companies, locations))
+
+    # Dedupe by (title, company, location)
+    if dedupe and (dedupe_memory_mb is not None or dedupe_approx):
+        budget = int((dedupe_memory_mb or DEDUPE_MEMORY_MB) * 1024 * 1024)
+        seen = _BloomFilter(budget) if dedupe_approx else _HashedKeySet(budget)
+        rows = _hashed_dedupe(rows, companies, locations, seen)
+    elif dedupe:
+        rows = _dedupe(rows, companies, locations)
+
+    # Sort (+ limit)
+    if sort_by:
+        if sort_by == "company":
+            key = lambda r: companies.lower[r[1]]
+        elif sort_by == "location":
+            key = lambda r: locations.lower[r[2]]
+        else:
+            key = None
+        rows = _sort_rows(rows, sort_by, limit, key)
+
+    # Limit
+    elif limit:
+        rows = islice(rows, limit)
+    return _decode_rows(rows, companies, locations, keep_extra)
+
+class _ColumnCodes:
+    """Dictionary encoding of a repeated text column, with lowercase forms kept per code."""
+
+    def __init__(self, strings: List[str] | None = None):
+        self.strings: List[str] = []
+        self.lower: List[str] = []
+        self.lower_code = array("I")  # code -> code of its lowercase form
+        self._codes: dict = {}
+        self._lower_codes: dict = {}
+        for s in strings or ():
+            self.encode(s)
+
+    def encode(self, s: str) -> int:
+        code = self._codes.get(s)
+        if code is None:
+            code = self._codes[s] = len(self.strings)
+            lc = s.lower()
+            self.strings.append(s)
+            self.lower.append(lc)
+            self.lower_code.append(self._lower_codes.setdefault(lc, len(self._lower_codes)))
+        return code
+
+def _encode_rows(
+    rows, companies: _ColumnCodes, locations: _ColumnCodes, extra: bool = False
+) -> Iterator[Tuple[str, int, int, str]]:
+    """`extra` carries any fields past the fourth through unchanged."""
+    if isinstance(rows, JobTable):  # already encoded with the same code order
+        dates = rows.dates
+        return zip(rows.titles, rows.company_codes, rows.location_codes, (dates[d] for d in rows.date_codes))
+    encode_company, encode_location = companies.encode, locations.encode
+    if extra:
+        return ((r[0], encode_company(r[1]), encode_location(r[2]), r[3], *r[4:]) for r in rows)
+    return ((r[0], encode_company(r[1]), encode_location(r[2]), r[3]) for r in rows)
+
+def _decode_rows(
+    rows, companies: _ColumnCodes, locations: _ColumnCodes, extra: bool = False
+) -> Iterator[Tuple[str, str, str, str]]:
+    company, location = companies.strings, locations.strings
+    if extra:
+        return ((r[0], company[r[1]], location[r[2]], *r[3:]) for r in rows)
+    return ((t, company[c], location[l], d) for t, c, l, d in rows)
+
+def _location_filter(locations: _ColumnCodes, location: str | None, state: str | None, prefix: str | None):
+    """Location code -> keep?, evaluated once per distinct location; None when unfiltered."""
+    if not (location or state or prefix):
+        return None
+    location = location.lower() if location else None
+    state = state.strip().lower() if state else None
+    prefix = prefix.lower() if prefix else None
+    memo: dict = {}
+
+    def location_ok(code: int) -> bool:
+        ok = memo.get(code)
+        if ok is None:
+            loc = locations.lower[code]
+            ok = memo[code] = (not location or location in loc) and _location_matches(loc, state, prefix)
+        return ok
+    return location_ok
+
+_SORT_COLUMNS = {"title": 0, "company": 1, "location": 2, "date": 3}
+
+def _sort_rows(
+    rows: Iterable[tuple], sort_by: str, limit: int | None = None, key=None
+) -> List[tuple]:
+    """
+    Sort by a column (dates newest first, unparseable dates last as
+    datetime.min; text columns case-insensitive A-Z). With `limit`, the
+    heapq n-smallest/n-largest selection returns exactly sorted(...)[:limit]
+    (same stable tie order) in O(n log limit). `key` overrides the text
+    column key, e.g. for encoded rows.
+    """
+    if sort_by == "date":
+        key = key or (lambda r: _parse_date(r[3]) or datetime.min)
+        if limit:
+            return heapq.nlargest(limit, rows, key=key)
+        return sorted(rows, key=key, reverse=True)
+
+    idx = _SORT_COLUMNS[sort_by]
+    key = key or (lambda r: (r[idx] or "").lower())
+    if limit:
+        return heapq.nsmallest(limit, rows, key=key)
+    return sorted(rows, key=key)
+
+def _dedupe(rows: Iterable[Tuple[str, int, int, str]], companies: _ColumnCodes, locations: _ColumnCodes):
+    """Keep the first row per lowercase (title, company, location), comparing codes."""
+    seen = set()
+    company_lc, location_lc = companies.lower_code, locations.lower_code
+    for r in rows:
+        key = (r[0].lower(), company_lc[r[1]], location_lc[r[2]])
+        if key not in seen:
+            seen.add(key)
+            yield r
+
+class _HashedKeySet:
+    """
+    Exact set of fixed-size key digests with a memory budget. Digests live
+    in an in-memory set until it reaches the budget, then are written out
+    as a sorted run file; lookups binary-search each run through mmap.
+    Runs are merged once there are more than MAX_RUNS of them.
+    """
+
+    ENTRY_BYTES = 120  # rough in-memory cost of one digest in a set
+    MAX_RUNS = 8
+
+    def __init__(self, budget_bytes: int):
+        self.max_entries = max(1024, budget_bytes // self.ENTRY_BYTES)
+        self._mem: set = set()
+        self._tmp: tempfile.TemporaryDirectory | None = None
+        self._runs: List[Tuple[Path, mmap.mmap | None]] = []
+        self._run_count = 0
+
+    def add(self, digest: bytes) -> bool:
+        """Add `digest`; returns False if it was already present."""
+        if digest in self._mem or any(self._in_run(m, digest) for _, m in self._runs):
+            return False
+        self._mem.add(digest)
+        if len(self._mem) >= self.max_entries:
+            self._spill()
+        return True
+
+    @staticmethod
+    def _in_run(m: mmap.mmap | None, digest: bytes) -> bool:
+        if m is None:
+            return False
+        size = DEDUPE_DIGEST_SIZE
+        lo, hi = 0, len(m) // size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = m[mid * size:(mid + 1) * size]
+            if probe == digest:
+                return True
+            if probe < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        return False
+
+    def _spill(self):
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="dedupe-")
+        self._write_run(sorted(self._mem))
+        self._mem.clear()
+        if len(self._runs) > self.MAX_RUNS:
+            self._merge_runs()
+
+    def _write_run(self, digests: Iterable[bytes]):
+        self._run_count += 1
+        path = Path(self._tmp.name) / f"run{self._run_count}.bin"
+        with path.open("wb") as f:
+            for d in digests:
+                f.write(d)
+        self._runs.append((path, self._map(path)))
+
+    @staticmethod
+    def _map(path: Path) -> mmap.mmap | None:
+        if not path.stat().st_size:
+            return None
+        with path.open("rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _records(m: mmap.mmap) -> Iterator[bytes]:
+        size = DEDUPE_DIGEST_SIZE
+        for i in range(0, len(m), size):
+            yield m[i:i + size]
+
+    def _merge_runs(self):
+        old, self._runs = self._runs, []
+        self._write_run(heapq.merge(*(self._records(m) for _, m in old if m is not None)))
+        for path, m in old:
+            if m is not None:
+                m.close()
+            path.unlink()
+
+    def close(self):
+        for _, m in self._runs:
+            if m is not None:
+                m.close()
+        self._runs = []
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+class _BloomFilter:
+    """
+    Approximate key set in a fixed `budget_bytes` bit array: never misses a
+    repeat, but may rarely report a new key as seen (dropping a unique row).
+    """
+
+    HASHES = 7
+    MIN_BYTES = 64 * 1024  # below this the filter saturates and drops unique rows
+
+    def __init__(self, budget_bytes: int):
+        if budget_bytes < self.MIN_BYTES:
+            raise ValueError(f"--dedupe-approx needs --dedupe-memory of at least {self.MIN_BYTES / 1024 / 1024:g} MB.")
+        self.n_bits = budget_bytes * 8
+        self.bits = bytearray(budget_bytes)
+
+    def add(self, digest: bytes) -> bool:
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:16], "little") | 1
+        new = False
+        for i in range(self.HASHES):
+            bit = (h1 + i * h2) % self.n_bits
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                new = True
+        return new
+
+    def close(self):
+        pass
+
+def _key_digest(title_lc: str, company_lc: str, location_lc: str) -> bytes:
+    """Fixed-size digest of a normalized (title, company, location) key."""
+    key = f"{title_lc}\x1f{company_lc}\x1f{location_lc}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=DEDUPE_DIGEST_SIZE).digest()
+
+def _hashed_dedupe(rows, companies: _ColumnCodes, locations: _ColumnCodes, seen):
+    """Like _dedupe(), but remembers only a 128-bit digest of each normalized key."""
+    company_lc, location_lc = companies.lower, locations.lower
+    try:
+        for r in rows:
+            if seen.add(_key_digest(r[0].lower(), company_lc[r[1]], location_lc[r[2]])):
+                yield r
+    finally:
+        seen.close()
+
+def _open_output(path: Path, mode: str, compress_level: int | None = None):
+    """
+    Open a text output stream, compressing on the fly by extension:
+    .gz (gzip), .xz (lzma) or .zst (zstandard, if installed). Appending
+    adds a new compressed member/frame, which all three formats read back
+    as one continuous stream.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        level = 6 if compress_level is None else compress_level
+        return gzip.open(path, mode + "t", compresslevel=level, encoding="utf-8", newline="")
+    if suffix == ".xz":
+        return lzma.open(path, mode + "t", preset=compress_level, encoding="utf-8", newline="")
+    if suffix == ".zst":
+        if zstandard is None:
+            raise ValueError(".zst output needs the zstandard package (pip install zstandard).")
+        level = 3 if compress_level is None else compress_level
+        raw = path.open(mode + "b")
+        stream = zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(io.BufferedWriter(stream, WRITE_BUFFER), encoding="utf-8", newline="")
+    return path.open(mode, newline="", encoding="utf-8", buffering=WRITE_BUFFER)
+
+def _write_csv(
+    out_path: Path,
+    rows: Iterable[Tuple[str, str, str, str]],
+    append: bool = False,
+    compress_level: int | None = None,
+    header: List[str] = CSV_HEADER,
+) -> int:
+    """
+    Write rows under `header` through a large buffer, in writerows()
+    batches of the row tuples themselves. `append` adds to an existing
+    file without a second header; .gz/.xz/.zst paths are compressed.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    append = append and out_path.exists() and out_path.stat().st_size > 0
+    count = 0
+    with _open_output(out_path, "a" if append else "w", compress_level) as f:
+        w = csv.writer(f)
+        if not append:
+            w.writerow(header)
+        rows = iter(rows)
+        while batch := list(islice(rows, WRITE_BATCH)):
+            w.writerows(batch)
+            count += len(batch)
+    return count
+
+class ColumnarWriter:
+    """
+    Streams rows into a columnar file, one row group at a time.
+
+    `.parquet` is written with pyarrow when it is installed. `.jobcol` is
+    the built-in fallback: per row group, each column is a separate block
+    (text: uint32 lengths + UTF-8 bytes; Date Posted: int32 day ordinals,
+    0 = unparseable), with a JSON footer of block offsets so a reader can
+    load single columns without touching the others. Dates are typed in
+    both formats (date32 in Parquet).
+    """
+
+    def __init__(self, path: Path, row_group_size: int = ROW_GROUP_SIZE):
+        self.path = path
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._batch: List[tuple] = []
+        self._groups: List[dict] = []
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix.lower() == ".parquet":
+            if pyarrow is None:
+                raise ValueError(".parquet output needs the pyarrow package (use .jobcol for the built-in format).")
+            self._schema = pyarrow.schema([(n, pyarrow.string()) for n in CSV_HEADER[:3]]
+                                          + [(CSV_HEADER[3], pyarrow.date32())])
+            self._parquet = pyarrow_parquet.ParquetWriter(str(path), self._schema)
+            self._f = None
+        else:
+            self._parquet = None
+            self._f = path.open("wb")
+            self._f.write(COLUMNAR_MAGIC)
+
+    def write_rows(self, rows: Iterable[Tuple[str, str, str, str]]):
+        for r in rows:
+            self._batch.append(r)
+            if len(self._batch) >= self.row_group_size:
+                self._flush()
+
+    def _flush(self):
+        if not self._batch:
+            return
+        titles, companies, locations, dates = zip(*((r[0], r[1], r[2], r[3]) for r in self._batch))
+        days = [_parse_date(d) for d in dates]
+        if self._parquet is not None:
+            self._parquet.write_table(pyarrow.table(
+                [list(titles), list(companies), list(locations), [d.date() if d else None for d in days]],
+                schema=self._schema,
+            ))
+        else:
+            group = {"rows": len(self._batch), "columns": {}}
+            for name, values in zip(CSV_HEADER, (titles, companies, locations)):
+                encoded = [v.encode("utf-8") for v in values]
+                block = array("I", map(len, encoded)).tobytes() + b"".join(encoded)
+                group["columns"][name] = self._write_block(block)
+            ordinals = array("i", (d.toordinal() if d else 0 for d in days))
+            group["columns"][CSV_HEADER[3]] = self._write_block(ordinals.tobytes())
+            self._groups.append(group)
+        self.count += len(self._batch)
+        self._batch = []
+
+    def _write_block(self, block: bytes) -> Tuple[int, int]:
+        offset = self._f.tell()
+        self._f.write(block)
+        return offset, len(block)
+
+    def close(self):
+        self._flush()
+        if self._parquet is not None:
+            self._parquet.close()
+            return
+        footer = json.dumps({"header": CSV_HEADER, "row_groups": self._groups}).encode("utf-8")
+        self._f.write(footer)
+        self._f.write(struct.pack("<Q", len(footer)) + COLUMNAR_MAGIC)
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_columnar(path: Path, columns: List[str] | None = None) -> dict:
+    """
+    Load the named columns (default: all) from .jobcol/.parquet output as
+    {name: list}. Date Posted values are datetime.date, or None when the
+    scraped date could not be parsed.
+    """
+    columns = columns or CSV_HEADER
+    if path.suffix.lower() == ".parquet":
+        if pyarrow_parquet is None:
+            raise ValueError("Reading .parquet needs the pyarrow package.")
+        return pyarrow_parquet.read_table(str(path), columns=columns).to_pydict()
+    with path.open("rb") as f:
+        f.seek(-(8 + len(COLUMNAR_MAGIC)), os.SEEK_END)
+        tail = f.read()
+        if tail[8:] != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a .jobcol file.")
+        (footer_len,) = struct.unpack("<Q", tail[:8])
+        f.seek(-(8 + len(COLUMNAR_MAGIC) + footer_len), os.SEEK_END)
+        meta = json.loads(f.read(footer_len))
+        out: dict = {name: [] for name in columns}
+        for group in meta["row_groups"]:
+            n = group["rows"]
+            for name in columns:
+                offset, length = group["columns"][name]
+                f.seek(offset)
+                block = f.read(length)
+                if name == CSV_HEADER[3]:
+                    ordinals = array("i")
+                    ordinals.frombytes(block)
+                    out[name].extend(date.fromordinal(o) if o else None for o in ordinals)
+                    continue
+                lengths = array("I")
+                lengths.frombytes(block[:4 * n])
+                pos = 4 * n
+                for size in lengths:
+                    out[name].append(block[pos:pos + size].decode("utf-8"))
+                    pos += size
+    return out
+
+COLUMNAR_SUFFIXES = (".parquet", ".jobcol")
+
+def _write_output(
+    out_path: Path,
+    rows: Iterable[Tuple[str, str, str, str]],
+    append: bool = False,
+    compress_level: int | None = None,
+    header: List[str] = CSV_HEADER,
+) -> int:
+    """Write rows as columnar output for .parquet/.jobcol paths, CSV otherwise."""
+    if out_path.suffix.lower() not in COLUMNAR_SUFFIXES:
+        return _write_csv(out_path, rows, append, compress_level, header)
+    if append:
+        raise ValueError("--append is only supported for CSV output.")
+    if header != CSV_HEADER:
+        raise ValueError("Columnar output only has the four listing columns; use CSV with --with-details.")
+    with ColumnarWriter(out_path) as w:
+        w.write_rows(rows)
+    return w.count
+
+class IncrementalState:
+    """
+    Posting keys seen by earlier --incremental runs, stored as digests of
+    the normalized (title, company, location) with the date each was last
+    seen, so a run only has to emit what is new.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.seen: dict = {}
+        if path.exists():
+            with path.open("rb") as f:
+                payload = pickle.load(f)
+            if payload.get("version") != STATE_VERSION:
+                raise ValueError(f"{path} is not a version {STATE_VERSION} state file.")
+            self.seen = payload["seen"]
+
+    def new_rows(self, rows: Iterable[Tuple[str, str, str, str]]) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield rows whose key is unseen; marks every row as seen today."""
+        today = date.today().isoformat()
+        for r in rows:
+            digest = _key_digest(r[0].lower(), r[1].lower(), r[2].lower())
+            is_new = digest not in self.seen
+            self.seen[digest] = today
+            if is_new:
+                yield r
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("wb") as f:
+            pickle.dump({"version": STATE_VERSION, "seen": self.seen}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
+
+def fake_jobs_source(
+    urls: List[str] | None = None,
+    concurrency: int = 1,
+    rate: float | None = None,
+    cache: HttpCache | None = None,
+    parser: str = "html.parser",
+    stream: bool = False,
+    workers: int = 1,
+    crawl: bool = False,
+    max_depth: int = 1,
+    crawl_delay: float | None = CRAWL_DELAY,
+    max_pages: int | None = None,
+    from_files: List[Path] | None = None,
+    links: bool = False,
+) -> Iterable[Tuple[str, str, str, str]]:
+    """
+    The card rows for one run, from saved pages, a crawl, a streamed
+    download or a plain fetch, after rejecting option combinations that
+    don't fit together. `links` appends each card's detail URL.
+    """
+    if crawl and stream:
+        raise ValueError("--crawl can't be combined with --stream.")
+    if links and stream:
+        raise ValueError("--with-details can't be combined with --stream.")
+    if from_files is not None and (crawl or links):
+        raise ValueError("--crawl and --with-details need the network; use them without --from-file/--from-dir.")
+    if from_files is not None:
+        return load_fake_jobs(from_files, parser, workers, stream)
+    if crawl:
+        return crawl_fake_jobs(urls, max_depth, concurrency, rate, cache, parser, crawl_delay, max_pages, links)
+    if stream:
+        return stream_fake_jobs(urls)
+    return scrape_fake_jobs(urls, concurrency, rate, cache, parser, workers, links)
+
 def scrape_fake_jobs_to_csv(
     out_path: Path,
     include: List[str] | None = None,
@@ -111,6 +1513,30 @@ def scrape_fake_jobs_to_csv(
     dedupe: bool = False,
     sort_by: str | None = None,  # 'date' | 'title' | 'company' | 'location'
     limit: int | None = None,
+    urls: List[str] | None = None,
+    concurrency: int = 1,
+    rate: float | None = None,
+    cache: HttpCache | None = None,
+    parser: str = "html.parser",
+    stream: bool = False,
+    index_dir: Path | None = None,
+    state: str | None = None,
+    location_prefix: str | None = None,
+    dedupe_memory_mb: float | None = None,
+    dedupe_approx: bool = False,
+    incremental: bool = False,
+    state_path: Path | None = None,
+    delta_path: Path | None = None,
+    append: bool = False,
+    compress_level: int | None = None,
+    workers: int = 1,
+    crawl: bool = False,
+    max_depth: int = 1,
+    crawl_delay: float | None = CRAWL_DELAY,
+    max_pages: int | None = None,
+    details: bool = False,
+    detail_concurrency: int = DETAIL_CONCURRENCY,
+    from_files: List[Path] | None = None,
 ) -> int:
     """
     Scrape fake job postings and write to CSV with header:
@@ -118,100 +1544,641 @@ def scrape_fake_jobs_to_csv(
 
     Bonus:
       - include/exclude keyword filters (case-insensitive)
-      - location contains filter
+      - location contains / starts-with / state-code filters
       - since (YYYY-MM-DD) date cutoff
-      - dedupe by (title, company, location)
+      - dedupe by (title, company, location), optionally by hashed key
+        within a memory budget (exact with disk spill, or Bloom filter)
       - sort by date/title/company/location
       - limit N rows after sort
+      - several listing pages fetched concurrently (per-host rate limit)
+      - optional conditional-GET page cache
+      - html.parser / lxml / stream card extraction backends
+      - pages parsed by a pool of worker processes
+      - crawl mode following pagination and detail links (depth limit,
+        per-host politeness delay, bounded frontier and visited set)
+      - Description column from each job's detail page, fetched
+        concurrently and cached, for the rows that survive the filters
+      - offline replay of saved listing pages (from_files)
+      - streaming download: rows are filtered and written as cards arrive
+      - optional keyword and BM25 search indexes of the output saved to index_dir
+      - incremental runs: only postings not seen by earlier runs are
+        appended to out_path (or written to delta_path)
+      - columnar output (.parquet / built-in .jobcol) instead of CSV
     """
-    url = "https://realpython.github.io/fake-jobs/"
-    resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    if incremental and index_dir is not None:
+        raise ValueError("--index-dir can't be combined with --incremental.")
+    if incremental and delta_path is None and out_path.suffix.lower() in COLUMNAR_SUFFIXES:
+        raise ValueError("--incremental appends new rows to --out, so --out must be CSV; "
+                         "use --delta for columnar output.")
+    rows = fake_jobs_source(
+        urls, concurrency, rate, cache, parser, stream, workers, crawl, max_depth, crawl_delay, max_pages,
+        from_files, details,
+    )
+    rows = filter_rows(
+        rows, include, exclude, location, since_str, dedupe, sort_by, limit, state, location_prefix,
+        dedupe_memory_mb, dedupe_approx, details,
+    )
+    if incremental:
+        inc_state = IncrementalState(state_path or out_path.with_name(out_path.name + ".state"))
+        rows = inc_state.new_rows(rows)
+        if delta_path is not None:
+            out_path, append = delta_path, False
+        else:
+            append = True
+    header = CSV_HEADER
+    if details:  # only rows that made it this far cost a detail fetch
+        rows = with_details(rows, detail_concurrency, _polite_rate(rate, crawl_delay) if crawl else rate, cache)
+        header = DETAILS_HEADER
+    if incremental:
+        count = _write_output(out_path, rows, append, compress_level, header)
+        inc_state.save()
+        return count
+    if index_dir is None:
+        return _write_output(out_path, rows, append, compress_level, header)
+    rows = list(rows)
+    count = _write_output(out_path, rows, append, compress_level, header)
+    save_indexes(index_dir, rows)
+    return count
 
-    cards = soup.select("div.card-content")
-    rows: List[Tuple[str, str, str, str]] = []
-    for c in cards:
-        title = _txt(c.select_one("h2.title"))
-        company = _txt(c.select_one("h3.subtitle"))
-        loc = _txt(c.select_one("p.location"))
-        date_posted = _txt(c.select_one("time"))
-        rows.append((title, company, loc, date_posted))
+class JobTable:
+    """
+    Column-oriented row store. Titles are kept as a plain list; company,
+    location and date are dictionary-encoded (one copy of each distinct
+    string plus an array of integer codes), which is what makes
+    multi-million-row corpora fit comfortably in memory. Indexing and
+    iteration produce plain tuples; filter_rows() works on the codes
+    directly, normalizing each distinct company/location once.
+    """
 
-    # Filters
-    since_dt = None
-    if since_str:
-        try:
-            since_dt = datetime.strptime(since_str, "%Y-%m-%d")
-        except ValueError:
-            raise ValueError("Invalid --since format. Use YYYY-MM-DD.")
+    def __init__(self):
+        self.titles: List[str] = []
+        self.company_codes = array("I")
+        self.location_codes = array("I")
+        self.date_codes = array("I")
+        self.companies: List[str] = []
+        self.locations: List[str] = []
+        self.dates: List[str] = []
+        self._lookup: Tuple[dict, dict, dict] = ({}, {}, {})
 
-    rows = [r for r in rows if _passes_filters(
-        r, include or [], exclude or [], location, since_dt
-    )]
+    @staticmethod
+    def _encode(value: str, lookup: dict, strings: List[str]) -> int:
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(strings)
+            strings.append(value)
+        return code
 
-    # Dedupe by (title, company, location)
-    if dedupe:
-        seen = set()
-        new_rows = []
+    def append(self, row: Iterable[str]):
+        title, company, location, date = row
+        companies, locations, dates = self._lookup
+        self.titles.append(title)
+        self.company_codes.append(self._encode(company, companies, self.companies))
+        self.location_codes.append(self._encode(location, locations, self.locations))
+        self.date_codes.append(self._encode(date, dates, self.dates))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Iterable[str]]) -> "JobTable":
+        table = cls()
         for r in rows:
-            key = (r[0].lower(), r[1].lower(), r[2].lower())
-            if key not in seen:
-                seen.add(key)
-                new_rows.append(r)
-        rows = new_rows
+            table.append(r)
+        return table
 
-    # Sort
-    if sort_by:
-        idx_map = {"title": 0, "company": 1, "location": 2, "date": 3}
-        if sort_by not in idx_map:
-            raise ValueError("Invalid --sort. Choose: date, title, company, location")
-        idx = idx_map[sort_by]
-        if sort_by == "date":
-            rows.sort(key=lambda r: (_parse_date(r[3]) or datetime.min), reverse=True)
-        else:
-            rows.sort(key=lambda r: (r[idx] or "").lower())
+    def __len__(self) -> int:
+        return len(self.titles)
 
-    # Limit
-    if isinstance(limit, int) and limit > 0:
-        rows = rows[:limit]
+    def __getitem__(self, i: int) -> Tuple[str, str, str, str]:
+        return (self.titles[i], self.companies[self.company_codes[i]],
+                self.locations[self.location_codes[i]], self.dates[self.date_codes[i]])
 
-    # Write CSV
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["Job Title", "Company", "Location", "Date Posted"])
-        for r in rows:
-            w.writerow(list(r))
+    def __iter__(self) -> Iterator[Tuple[str, str, str, str]]:
+        companies, locations, dates = self.companies, self.locations, self.dates
+        for title, c, l, d in zip(self.titles, self.company_codes, self.location_codes, self.date_codes):
+            yield title, companies[c], locations[l], dates[d]
+
+    def to_columns(self) -> dict:
+        """Plain lists/arrays only, so pickles don't depend on this module's import name."""
+        return {
+            "titles": self.titles,
+            "companies": self.companies, "company_codes": self.company_codes,
+            "locations": self.locations, "location_codes": self.location_codes,
+            "dates": self.dates, "date_codes": self.date_codes,
+        }
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> "JobTable":
+        table = cls()
+        for name, value in columns.items():
+            setattr(table, name, value)
+        table._lookup = tuple(
+            {v: code for code, v in enumerate(strings)}
+            for strings in (table.companies, table.locations, table.dates)
+        )
+        return table
+
+def save_snapshot(path: Path, rows: Iterable[Tuple[str, str, str, str]]) -> int:
+    """Store scraped rows as a versioned, dictionary-encoded JobTable pickle."""
+    table = rows if isinstance(rows, JobTable) else JobTable.from_rows(rows)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        pickle.dump(
+            {"version": SNAPSHOT_VERSION, "header": CSV_HEADER, "table": table.to_columns()},
+            f, protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    return len(table)
+
+def load_snapshot(path: Path) -> JobTable:
+    """Read rows written by save_snapshot() (version 1 column-list snapshots too)."""
+    with path.open("rb") as f:
+        payload = pickle.load(f)
+    version = payload.get("version") if isinstance(payload, dict) else None
+    if version == 1:
+        return JobTable.from_rows(zip(*payload["columns"]))
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} snapshot; re-run snapshot.")
+    return JobTable.from_columns(payload["table"])
+
+def query_snapshot_to_csv(
+    snapshot_path: Path, out_path: Path, append: bool = False, compress_level: int | None = None, **filters
+) -> int:
+    """Re-run the filter pipeline over a saved snapshot (no network) and write CSV."""
+    rows = filter_rows(load_snapshot(snapshot_path), **filters)
+    return _write_output(out_path, rows, append, compress_level)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+def _save_index(path: Path, kind: str, data: dict):
+    with path.open("wb") as f:
+        pickle.dump({"version": INDEX_VERSION, "kind": kind, **data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _load_index(path: Path, kind: str) -> dict:
+    with path.open("rb") as f:
+        payload = pickle.load(f)
+    if payload.get("version") != INDEX_VERSION or payload.get("kind") != kind:
+        raise ValueError(f"{path} is not a version {INDEX_VERSION} {kind} index; re-run fakejobs --index-dir.")
+    return payload
+
+class KeywordIndex:
+    """
+    Inverted index from lowercase word tokens of title/company/location to
+    sorted row ids.
+
+    Used to narrow --include/--exclude before the exact substring filter
+    runs, so results are always identical to a full scan: an include term
+    only keeps rows having, for each of its tokens, some token that
+    contains it; an exclude term that is one whole token drops its posting
+    list outright.
+    """
+
+    FILE = "keywords.idx"
+
+    def __init__(self, postings: dict, n_rows: int):
+        self.postings = postings
+        self.n_rows = n_rows
+
+    @classmethod
+    def build(cls, rows: List[Tuple[str, str, str, str]]) -> "KeywordIndex":
+        postings: dict = {}
+        for i, r in enumerate(rows):
+            for tok in set(_TOKEN_RE.findall(f"{r[0]} {r[1]} {r[2]}".lower())):
+                postings.setdefault(tok, array("I")).append(i)
+        return cls(postings, len(rows))
+
+    def save(self, index_dir: Path):
+        _save_index(index_dir / self.FILE, "keywords", {"rows": self.n_rows, "postings": self.postings})
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "KeywordIndex":
+        payload = _load_index(index_dir / cls.FILE, "keywords")
+        return cls(payload["postings"], payload["rows"])
+
+    def _containing(self, fragment: str) -> set:
+        """Row ids having a token that contains `fragment`."""
+        posting = self.postings.get(fragment)
+        ids = set(posting) if posting is not None else set()
+        for tok, posting in self.postings.items():
+            if fragment in tok and tok != fragment:
+                ids.update(posting)
+        return ids
+
+    def candidates(self, include: Iterable[str], exclude: Iterable[str]) -> List[int] | None:
+        """Sorted row ids that may pass the keyword filters, or None if the index can't narrow."""
+        ids = None
+        for term in include:
+            for frag in _TOKEN_RE.findall(term.lower()):
+                found = self._containing(frag)
+                ids = found if ids is None else ids & found
+        dropped = set()
+        for term in exclude:
+            term = term.lower()
+            if _TOKEN_RE.fullmatch(term):
+                dropped.update(self.postings.get(term, ()))
+        if ids is None and not dropped:
+            return None
+        if ids is None:
+            ids = set(range(self.n_rows))
+        return sorted(ids - dropped)
+
+class DateIndex:
+    """
+    Row ids in `--sort date` order (newest first, ties in original order,
+    unparseable dates last as datetime.min) with their negated day
+    ordinals, so a --since cutoff is one binary search and the matching
+    rows are a contiguous prefix that is already date-sorted.
+    """
+
+    FILE = "dates.idx"
+
+    def __init__(self, order: array, keys: array, undated: frozenset):
+        self.order = order
+        self.keys = keys  # -ordinal per entry of `order`, ascending
+        self.undated = undated
+
+    @classmethod
+    def build(cls, rows: List[Tuple[str, str, str, str]]) -> "DateIndex":
+        ordinals = []
+        undated = set()
+        for i, r in enumerate(rows):
+            d = _parse_date(r[3])
+            if d is None:
+                undated.add(i)
+                d = datetime.min
+            ordinals.append(d.toordinal())
+        order = sorted(range(len(rows)), key=lambda i: -ordinals[i])
+        return cls(array("I", order), array("i", (-ordinals[i] for i in order)), frozenset(undated))
+
+    def save(self, index_dir: Path):
+        _save_index(index_dir / self.FILE, "dates", {
+            "order": self.order, "keys": self.keys, "undated": self.undated,
+        })
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "DateIndex":
+        payload = _load_index(index_dir / cls.FILE, "dates")
+        return cls(payload["order"], payload["keys"], payload["undated"])
+
+    def since(self, cutoff: datetime) -> array:
+        """Ids of rows dated on/after `cutoff`, in date order."""
+        day = cutoff.toordinal()
+        window = self.order[:bisect_right(self.keys, -day)]
+        if day <= datetime.min.toordinal() and self.undated:
+            window = array("I", (i for i in window if i not in self.undated))
+        return window
+
+class LocationIndex:
+    """
+    Distinct lowercase locations (sorted) with their row ids, plus the
+    locations grouped by state code. Prefix and state lookups touch only
+    matching locations; a --location substring scans distinct locations
+    rather than every row.
+    """
+
+    FILE = "locations.idx"
+
+    def __init__(self, values: List[str], postings: List[array], states: dict):
+        self.values = values
+        self.postings = postings
+        self.states = states  # state code -> indexes into `values`
+
+    @classmethod
+    def build(cls, rows: List[Tuple[str, str, str, str]]) -> "LocationIndex":
+        by_value: dict = {}
+        for i, r in enumerate(rows):
+            by_value.setdefault(r[2].lower(), array("I")).append(i)
+        values = sorted(by_value)
+        states: dict = {}
+        for vi, v in enumerate(values):
+            states.setdefault(_split_location(v)[1], array("I")).append(vi)
+        return cls(values, [by_value[v] for v in values], states)
+
+    def save(self, index_dir: Path):
+        _save_index(index_dir / self.FILE, "locations", {
+            "values": self.values, "postings": self.postings, "states": self.states,
+        })
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "LocationIndex":
+        payload = _load_index(index_dir / cls.FILE, "locations")
+        return cls(payload["values"], payload["postings"], payload["states"])
+
+    def _ids(self, value_idxs: Iterable[int]) -> set:
+        ids = set()
+        for vi in value_idxs:
+            ids.update(self.postings[vi])
+        return ids
+
+    def containing(self, text: str) -> set:
+        text = text.lower()
+        return self._ids(vi for vi, v in enumerate(self.values) if text in v)
+
+    def with_prefix(self, prefix: str) -> set:
+        prefix = prefix.lower()
+        lo = bisect_left(self.values, prefix)
+        hi = lo
+        while hi < len(self.values) and self.values[hi].startswith(prefix):
+            hi += 1
+        return self._ids(range(lo, hi))
 
-    return len(rows)
+    def in_state(self, code: str) -> set:
+        return self._ids(self.states.get(code.strip().lower(), ()))
 
+class SearchIndex:
+    """
+    BM25 full-text index over title/company/location and, when rows carry
+    one (--with-details), the description.
+
+    search.idx holds the term dictionary (term -> postings offset and
+    document frequency) and each row's BM25 length norm; the postings
+    themselves (uint32 row ids, then uint32 term frequencies) live in
+    search.post and are read through mmap, so a query only touches the
+    posting lists of its own terms.
+    """
+
+    FILE = "search.idx"
+    POSTINGS = "search.post"
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, terms: dict, norms: array, descriptions: List[str] | None, postings):
+        self.terms = terms
+        self.norms = norms  # per row: K1 * (1 - B + B * length / average length)
+        self.descriptions = descriptions
+        self._postings = postings
+
+    @staticmethod
+    def _text(r: tuple) -> str:
+        return f"{r[0]} {r[1]} {r[2]} {r[4] if len(r) > 4 else ''}".lower()
+
+    @classmethod
+    def save_rows(cls, index_dir: Path, rows: List[tuple]):
+        tfs: dict = {}
+        lengths = array("I")
+        for i, r in enumerate(rows):
+            tokens = _TOKEN_RE.findall(cls._text(r))
+            lengths.append(len(tokens))
+            counts: dict = {}
+            for tok in tokens:
+                counts[tok] = counts.get(tok, 0) + 1
+            for tok, n in counts.items():
+                ids, freqs = tfs.setdefault(tok, (array("I"), array("I")))
+                ids.append(i)
+                freqs.append(n)
+        avg = sum(lengths) / len(lengths) if lengths else 1.0
+        norms = array("d", (cls.K1 * (1 - cls.B + cls.B * n / (avg or 1.0)) for n in lengths))
+        terms: dict = {}
+        with (index_dir / cls.POSTINGS).open("wb") as f:
+            for tok, (ids, freqs) in tfs.items():
+                terms[tok] = (f.tell(), len(ids))
+                f.write(ids.tobytes())
+                f.write(freqs.tobytes())
+        descriptions = [r[4] for r in rows] if any(len(r) > 4 for r in rows) else None
+        _save_index(index_dir / cls.FILE, "search", {
+            "rows": len(rows), "terms": terms, "norms": norms, "descriptions": descriptions,
+        })
+
+    @classmethod
+    def load(cls, index_dir: Path) -> "SearchIndex":
+        payload = _load_index(index_dir / cls.FILE, "search")
+        with (index_dir / cls.POSTINGS).open("rb") as f:
+            postings = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if payload["terms"] else b""
+        return cls(payload["terms"], payload["norms"], payload["descriptions"], postings)
+
+    def rank(self, query: str, limit: int | None = None, allowed: set | None = None) -> List[Tuple[int, float]]:
+        """
+        (row id, BM25 score) for rows matching any query term, best first
+        (ties by row id); only ids in `allowed`, when given, and only the
+        top `limit` (heap selection rather than a full sort).
+        """
+        n_rows = len(self.norms)
+        norms, k1 = self.norms, self.K1
+        scores: dict = {}
+        for term in set(_TOKEN_RE.findall(query.lower())):
+            entry = self.terms.get(term)
+            if entry is None:
+                continue
+            offset, df = entry
+            ids, freqs = array("I"), array("I")
+            ids.frombytes(self._postings[offset:offset + 4 * df])
+            freqs.frombytes(self._postings[offset + 4 * df:offset + 8 * df])
+            idf = math.log(1 + (n_rows - df + 0.5) / (df + 0.5))
+            for i, tf in zip(ids, freqs):
+                if allowed is None or i in allowed:
+                    scores[i] = scores.get(i, 0.0) + idf * tf * (k1 + 1) / (tf + norms[i])
+        key = lambda kv: (-kv[1], kv[0])
+        if limit:
+            return heapq.nsmallest(limit, scores.items(), key=key)
+        return sorted(scores.items(), key=key)
+
+def save_indexes(index_dir: Path, rows: List[tuple]):
+    """
+    Save `rows` plus the indexes used by `query --index-dir` and `search`
+    into `index_dir`. A fifth field (description) is only used by search.
+    """
+    index_dir.mkdir(parents=True, exist_ok=True)
+    save_snapshot(index_dir / "rows.snap", (r[:4] for r in rows))
+    KeywordIndex.build(rows).save(index_dir)
+    DateIndex.build(rows).save(index_dir)
+    LocationIndex.build(rows).save(index_dir)
+    SearchIndex.save_rows(index_dir, rows)
+
+def query_index_to_csv(
+    index_dir: Path,
+    out_path: Path,
+    include: List[str] | None = None,
+    exclude: List[str] | None = None,
+    location: str | None = None,
+    since_str: str | None = None,
+    dedupe: bool = False,
+    sort_by: str | None = None,
+    limit: int | None = None,
+    state: str | None = None,
+    location_prefix: str | None = None,
+    dedupe_memory_mb: float | None = None,
+    dedupe_approx: bool = False,
+    append: bool = False,
+    compress_level: int | None = None,
+) -> int:
+    """
+    Like query_snapshot_to_csv(), but narrows rows through the saved
+    indexes first: keyword postings for --include/--exclude, the location
+    index for --location/--state/--location-prefix, and a binary search of
+    the date index for --since. --sort date reuses the index order instead
+    of parsing and sorting dates again.
+    """
+    rows = load_snapshot(index_dir / "rows.snap")
+    ids = KeywordIndex.load(index_dir).candidates(include or [], exclude or [])
+
+    if location or state or location_prefix:
+        places = LocationIndex.load(index_dir)
+        for found in (
+            places.containing(location) if location else None,
+            places.in_state(state) if state else None,
+            places.with_prefix(location_prefix) if location_prefix else None,
+        ):
+            if found is not None:
+                ids = sorted(found if ids is None else found.intersection(ids))
+
+    window = None  # date-ordered candidate ids, when the date index is used
+    if since_str or sort_by == "date":
+        dates = DateIndex.load(index_dir)
+        window = dates.since(_parse_since(since_str)) if since_str else dates.order
+        if ids is not None:
+            allowed = set(ids)
+            window = [i for i in window if i in allowed]
+        ids = sorted(window)  # filters and dedupe run in original row order
+
+    subset = [rows[i] for i in ids] if ids is not None else rows
+    opts = dict(  # location/since: exact via indexes
+        include=include, exclude=exclude, dedupe=dedupe,
+        dedupe_memory_mb=dedupe_memory_mb, dedupe_approx=dedupe_approx,
+    )
+    if sort_by != "date":
+        rows = filter_rows(subset, sort_by=sort_by, limit=limit, **opts)
+        return _write_output(out_path, rows, append, compress_level)
+
+    # Survivors are an in-order subsequence of `subset`; map them back to ids
+    # (equal rows are interchangeable, so the earliest match is fine)
+    kept = set()
+    pos = 0
+    for r in filter_rows(subset, **opts):
+        while subset[pos] != r:
+            pos += 1
+        kept.add(ids[pos])
+        pos += 1
+    out = (rows[i] for i in window if i in kept)
+    if isinstance(limit, int) and limit > 0:
+        out = islice(out, limit)
+    return _write_output(out_path, out, append, compress_level)
+
+def search_index_to_csv(
+    index_dir: Path,
+    out_path: Path,
+    query: str,
+    location: str | None = None,
+    since_str: str | None = None,
+    limit: int | None = SEARCH_LIMIT,
+    state: str | None = None,
+    location_prefix: str | None = None,
+    compress_level: int | None = None,
+) -> int:
+    """
+    Write the BM25-ranked rows for free-text `query` from an --index-dir,
+    best first with a Score column. The location/state/prefix and since
+    filters are applied to the ranked list through the saved indexes.
+    """
+    if out_path.suffix.lower() in COLUMNAR_SUFFIXES:
+        raise ValueError("search writes CSV only (.csv, optionally .gz/.xz/.zst).")
+    since_dt = _parse_since(since_str) if since_str else None
+    if not (isinstance(limit, int) and limit > 0):
+        limit = None
 
+    allowed = None
+    if location or state or location_prefix:
+        places = LocationIndex.load(index_dir)
+        for found in (
+            places.containing(location) if location else None,
+            places.in_state(state) if state else None,
+            places.with_prefix(location_prefix) if location_prefix else None,
+        ):
+            if found is not None:
+                allowed = set(found) if allowed is None else allowed.intersection(found)
+    if since_dt is not None:
+        found = DateIndex.load(index_dir).since(since_dt)
+        allowed = set(found) if allowed is None else allowed.intersection(found)
+    index = SearchIndex.load(index_dir)
+    ranked = index.rank(query, limit, allowed)
 
+    rows = load_snapshot(index_dir / "rows.snap")
+    header = ["Score"] + CSV_HEADER
+    if index.descriptions is not None:
+        header = ["Score"] + DETAILS_HEADER
+        out = ((f"{score:.4f}", *rows[i], index.descriptions[i]) for i, score in ranked)
+    else:
+        out = ((f"{score:.4f}", *rows[i]) for i, score in ranked)
+    return _write_csv(out_path, out, compress_level=compress_level, header=header)
 
 def main():
     parser = argparse.ArgumentParser(description="Job Search helper CLI")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="Keep-alive connections per host")
     sub = parser.add_subparsers(dest="cmd")
 
+    # Shared option groups
+    fetch_opts = argparse.ArgumentParser(add_help=False)
+    offline = fetch_opts.add_mutually_exclusive_group()
+    offline.add_argument("--from-file", nargs="+", default=None, help="Parse these saved listing pages instead of fetching")
+    offline.add_argument("--from-dir", default=None, help="Parse every saved .html listing page in this directory")
+    fetch_opts.add_argument("--url", dest="urls", nargs="+", default=[FAKE_JOBS_URL], help="Listing page URL(s) to scrape")
+    fetch_opts.add_argument("--concurrency", type=int, default=1, help="Fetch up to N pages at once")
+    fetch_opts.add_argument("--rate", type=float, default=None, help="Max requests per second per host")
+    fetch_opts.add_argument("--cache-dir", default=CACHE_DIR, help="Directory for the conditional-GET page cache")
+    fetch_opts.add_argument("--cache-max-mb", type=int, default=CACHE_MAX_MB, help="Evict least recently used pages beyond this size")
+    fetch_opts.add_argument("--no-cache", action="store_true", help="Always download pages, bypassing the cache")
+    fetch_opts.add_argument("--parser", choices=PARSERS, default="html.parser", help="Card extraction backend")
+    fetch_opts.add_argument("--stream", action="store_true", help="Parse pages while downloading (one page at a time, no cache)")
+    fetch_opts.add_argument("--crawl", action="store_true", help="Follow pagination and Apply links from the --url pages")
+    fetch_opts.add_argument("--max-depth", type=int, default=1, help="With --crawl: link hops to follow from the start pages")
+    fetch_opts.add_argument("--crawl-delay", type=float, default=CRAWL_DELAY, help="With --crawl: min seconds between requests to one host")
+    fetch_opts.add_argument("--max-pages", type=int, default=None, help="With --crawl: stop after fetching this many pages")
+    fetch_opts.add_argument("--workers", type=int, default=1, help="Parse pages in N worker processes (ignored with --stream)")
+
+    filter_opts = argparse.ArgumentParser(add_help=False)
+    filter_opts.add_argument("--out", default="fake_jobs.csv", help="Output path: CSV (.csv.gz/.xz/.zst compressed) or columnar .parquet/.jobcol")
+    filter_opts.add_argument("--compress-level", type=int, default=None, help="Compression level for .gz/.xz/.zst output")
+    filter_opts.add_argument("--append", action="store_true", help="Append to --out instead of rewriting it (header only for a new file)")
+    filter_opts.add_argument("--include", nargs="*", default=[], help="Require these terms in title/company/location")
+    filter_opts.add_argument("--exclude", nargs="*", default=[], help="Exclude rows containing these terms")
+    filter_opts.add_argument("--location", default=None, help="Only keep rows whose location contains this text")
+    filter_opts.add_argument("--state", default=None, help="Only keep rows whose state code (after the comma) equals this")
+    filter_opts.add_argument("--location-prefix", default=None, help="Only keep rows whose location starts with this text")
+    filter_opts.add_argument("--since", dest="since_str", default=None, help="Only keep rows with Date Posted >= YYYY-MM-DD")
+    filter_opts.add_argument("--dedupe", action="store_true", help="Remove duplicates by (title, company, location)")
+    filter_opts.add_argument("--dedupe-memory", dest="dedupe_memory_mb", type=float, default=None, help="With --dedupe: keep hashed keys within this many MB, spilling to disk beyond it")
+    filter_opts.add_argument("--dedupe-approx", action="store_true", help="With --dedupe: use a Bloom filter (may rarely drop a unique row)")
+    filter_opts.add_argument("--sort", dest="sort_by", choices=["date", "title", "company", "location"], default=None, help="Sort rows by this column")
+    filter_opts.add_argument("--limit", type=int, default=None, help="Keep only the first N rows after sort")
+
     # Welcome (ASCII art + purpose)
     sub.add_parser("welcome", help="Show banner and explain purpose")
 
     # XULA mission
-    sub.add_parser("xula", help="Print XULA mission statement")
+    px = sub.add_parser("xula", help="Print XULA mission statement")
+    px.add_argument("--from-file", default=None, help="Read a saved copy of the page (e.g. web/xula.html)")
 
     # Morehouse mission
-    sub.add_parser("morehouse", help="Print Morehouse mission statement")
+    pm = sub.add_parser("morehouse", help="Print Morehouse mission statement")
+    pm.add_argument("--from-file", default=None, help="Read a saved copy of the page (e.g. web/other_university.html)")
+
+    # Synthetic listing pages for offline runs and benchmarks
+    psy = sub.add_parser("synthesize", help="Write synthetic fake-jobs listing pages for --from-dir")
+    psy.add_argument("--out-dir", default="fixtures", help="Directory to write page0000.html, page0001.html, ... into")
+    psy.add_argument("--pages", type=int, default=1, help="Number of pages")
+    psy.add_argument("--cards", type=int, default=100, help="Job cards per page")
 
     # Fake jobs -> CSV
-    pj = sub.add_parser("fakejobs", help="Scrape fake jobs to CSV (with filters)")
-    pj.add_argument("--out", default="fake_jobs.csv", help="Output CSV path")
-    pj.add_argument("--include", nargs="*", default=[], help="Require these terms in title/company/location")
-    pj.add_argument("--exclude", nargs="*", default=[], help="Exclude rows containing these terms")
-    pj.add_argument("--location", default=None, help="Only keep rows whose location contains this text")
-    pj.add_argument("--since", dest="since_str", default=None, help="Only keep rows with Date Posted >= YYYY-MM-DD")
-    pj.add_argument("--dedupe", action="store_true", help="Remove duplicates by (title, company, location)")
-    pj.add_argument("--sort", dest="sort_by", choices=["date", "title", "company", "location"], default=None, help="Sort rows by this column")
-    pj.add_argument("--limit", type=int, default=None, help="Keep only the first N rows after sort")
+    pj = sub.add_parser("fakejobs", parents=[filter_opts, fetch_opts], help="Scrape fake jobs to CSV (with filters)")
+    pj.add_argument("--with-details", action="store_true", help="Fetch each job's detail page and add a Description column")
+    pj.add_argument("--detail-concurrency", type=int, default=DETAIL_CONCURRENCY, help="Detail pages fetched at once")
+    pj.add_argument("--index-dir", default=None, help="Also save the output rows and their indexes here (see query --index-dir)")
+    pj.add_argument("--incremental", action="store_true", help="Only emit postings not seen by earlier --incremental runs (appends to --out)")
+    pj.add_argument("--state-file", dest="state_path", default=None, help="State file for --incremental (default: <out>.state)")
+    pj.add_argument("--delta", dest="delta_path", default=None, help="With --incremental: write new rows to this CSV instead of appending to --out")
+
+    # Fake jobs -> snapshot, then snapshot -> CSV without the network
+    ps = sub.add_parser("snapshot", parents=[fetch_opts], help="Scrape fake jobs once into a binary snapshot")
+    ps.add_argument("--out", default="fake_jobs.snap", help="Output snapshot path")
+    pq = sub.add_parser("query", parents=[filter_opts], help="Filter a saved snapshot to CSV (no network)")
+    pq.add_argument("--snapshot", default="fake_jobs.snap", help="Snapshot written by the snapshot command")
+    pq.add_argument("--index-dir", default=None, help="Query rows saved by fakejobs --index-dir instead of a snapshot")
+
+    pse = sub.add_parser("search", help="BM25-ranked free-text search over rows saved by fakejobs --index-dir")
+    pse.add_argument("query", nargs="+", help="Search words (any may match; rarer words weigh more)")
+    pse.add_argument("--index-dir", required=True, help="Directory written by fakejobs --index-dir")
+    pse.add_argument("--out", default="search_results.csv", help="Output CSV path (best match first, with a Score column)")
+    pse.add_argument("--compress-level", type=int, default=None, help="Compression level for .gz/.xz/.zst output")
+    pse.add_argument("--location", default=None, help="Keep results whose location contains this text")
+    pse.add_argument("--state", default=None, help="Keep results in this state code, e.g. AA")
+    pse.add_argument("--location-prefix", default=None, help="Keep results whose location starts with this text")
+    pse.add_argument("--since", default=None, help="Keep results posted on/after YYYY-MM-DD")
+    pse.add_argument("--limit", type=int, default=SEARCH_LIMIT, help="Number of results (0 = all)")
 
 
     args = parser.parse_args()
@@ -222,23 +2189,90 @@ def main():
         parser.print_help()
         return
 
+    # Keep at least one pooled connection per concurrent fetch
+    pool = max(args.pool_size, getattr(args, "concurrency", 1))
+    if getattr(args, "with_details", False):
+        pool = max(pool, args.detail_concurrency)
+    configure_session(pool)
+
+    from_files = None
+    if args.cmd in ("fakejobs", "snapshot") and (args.from_file or args.from_dir):
+        from_files = [Path(p) for p in (args.from_file or [args.from_dir])]
+    cache = None
+    if args.cmd in ("fakejobs", "snapshot") and not args.no_cache and from_files is None:
+        cache = HttpCache(Path(args.cache_dir), args.cache_max_mb * 1024 * 1024)
+    filters = {}
+    if args.cmd in ("fakejobs", "query"):
+        filters = dict(
+            include=args.include,
+            exclude=args.exclude,
+            location=args.location,
+            since_str=args.since_str,
+            dedupe=args.dedupe,
+            sort_by=args.sort_by,
+            limit=args.limit,
+            state=args.state,
+            location_prefix=args.location_prefix,
+            dedupe_memory_mb=args.dedupe_memory_mb,
+            dedupe_approx=args.dedupe_approx,
+        )
+
     try:
         if args.cmd == "xula":
-            print(scrape_xula_mission())
+            print(scrape_xula_mission(Path(args.from_file) if args.from_file else None))
         elif args.cmd == "morehouse":
-            print(scrape_morehouse_mission())
+            print(scrape_morehouse_mission(Path(args.from_file) if args.from_file else None))
         elif args.cmd == "fakejobs":
             count = scrape_fake_jobs_to_csv(
                 out_path=Path(args.out),
-                include=args.include,
-                exclude=args.exclude,
-                location=args.location,
-                since_str=args.since_str,
-                dedupe=args.dedupe,
-                sort_by=args.sort_by,
-                limit=args.limit,
+                urls=args.urls,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                cache=cache,
+                parser=args.parser,
+                stream=args.stream,
+                index_dir=Path(args.index_dir) if args.index_dir else None,
+                incremental=args.incremental,
+                state_path=Path(args.state_path) if args.state_path else None,
+                delta_path=Path(args.delta_path) if args.delta_path else None,
+                append=args.append,
+                compress_level=args.compress_level,
+                workers=args.workers,
+                crawl=args.crawl,
+                max_depth=args.max_depth,
+                crawl_delay=args.crawl_delay,
+                max_pages=args.max_pages,
+                details=args.with_details,
+                detail_concurrency=args.detail_concurrency,
+                from_files=from_files,
+                **filters,
             )
+            print(f"Wrote {count} rows to {args.delta_path if args.incremental and args.delta_path else args.out}")
+        elif args.cmd == "synthesize":
+            count = write_synthetic_pages(Path(args.out_dir), args.pages, args.cards)
+            print(f"Wrote {args.pages} pages ({count} cards) to {args.out_dir}")
+        elif args.cmd == "snapshot":
+            rows = fake_jobs_source(
+                args.urls, args.concurrency, args.rate, cache, args.parser, args.stream, args.workers,
+                args.crawl, args.max_depth, args.crawl_delay, args.max_pages, from_files,
+            )
+            count = save_snapshot(Path(args.out), rows)
+            print(f"Saved {count} rows to {args.out}")
+        elif args.cmd == "query":
+            if args.index_dir:
+                count = query_index_to_csv(Path(args.index_dir), Path(args.out), append=args.append,
+                                           compress_level=args.compress_level, **filters)
+            else:
+                count = query_snapshot_to_csv(Path(args.snapshot), Path(args.out), append=args.append,
+                                              compress_level=args.compress_level, **filters)
             print(f"Wrote {count} rows to {args.out}")
+        elif args.cmd == "search":
+            count = search_index_to_csv(
+                Path(args.index_dir), Path(args.out), " ".join(args.query),
+                location=args.location, since_str=args.since, limit=args.limit, state=args.state,
+                location_prefix=args.location_prefix, compress_level=args.compress_level,
+            )
+            print(f"Wrote {count} results to {args.out}")
         else:
             parser.print_help()
     except requests.HTTPError as e:
@@ -249,4 +2283,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,164 @@
+"""Regression tests for scraper.py. Run: python -m pytest -q"""
+import csv
+import random
+
+import pytest
+
+import scraper
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 7, 64, scraper.STREAM_CHUNK])
+@pytest.mark.parametrize("shift", [0, 2])
+def test_stream_parser_matches_html_parser_at_any_chunk_size(chunk, shift):
+    page = " " * shift + scraper.synthetic_page(200)
+    expected = scraper._extract_cards(page, "html.parser")
+    chunks = (page[i:i + chunk] for i in range(0, len(page), chunk))
+    assert list(scraper._stream_cards(chunks)) == expected
+
+
+_ODD_PAGES = [
+    "",
+    "   \n\t ",
+    "<!-- nothing here -->",
+    '<?xml version="1.0" encoding="utf-8"?>\n' + scraper.synthetic_page(3),
+    '<meta charset="iso-8859-1">' + scraper.synthetic_page(1).replace("</h2>", " Zürich</h2>", 1),
+]
+
+
+@pytest.mark.parametrize("page", [scraper.synthetic_page(50)] + _ODD_PAGES,
+                         ids=["cards", "empty", "blank", "comment", "xml-decl", "meta-charset"])
+def test_parser_backends_agree(page):
+    pytest.importorskip("lxml")
+    expected = scraper._extract_cards(page, "html.parser")
+    for parser in scraper.PARSERS:
+        assert scraper._extract_cards(page, parser) == expected, parser
+
+
+def test_http_cache_tracks_size_and_evicts_to_budget(tmp_path):
+    cache = scraper.HttpCache(tmp_path, max_bytes=50_000)
+    for i in range(40):
+        body_path, meta_path = cache._paths(f"https://example.com/{i}")
+        cache._store(body_path, meta_path, {"url": str(i), "encoding": "utf-8"}, b"x" * 5_000)
+    on_disk = sum(p.stat().st_size for p in tmp_path.glob("*.body"))
+    assert on_disk == cache._total <= 50_000
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_synthetic_rows_seed_is_not_fakejobs_output(tmp_path, monkeypatch):
+    assert scraper.SEED_CSV.resolve() != (scraper.Path.cwd() / "fake_jobs.csv").resolve()
+    rows = scraper.synthetic_rows(250)
+    assert len(rows) == len(set(rows)) == 250
+    empty = tmp_path / "seed.csv"
+    empty.write_text(",".join(scraper.CSV_HEADER) + "\n", encoding="utf-8")
+    monkeypatch.setattr(scraper, "SEED_CSV", empty)
+    with pytest.raises(ValueError):
+        scraper.synthetic_rows(10)
+
+
+def test_spilled_dedupe_matches_plain_dedupe(monkeypatch):
+    rows = scraper.synthetic_rows(12_000)
+    rows = rows + rows[::3] + [(t.upper(), c, l, d) for t, c, l, d in rows[::5]]
+    merges = []
+    merge = scraper._HashedKeySet._merge_runs
+    monkeypatch.setattr(scraper._HashedKeySet, "_merge_runs", lambda self: merges.append(1) or merge(self))
+    plain = list(scraper.filter_rows(rows, dedupe=True))
+    spilled = list(scraper.filter_rows(rows, dedupe=True, dedupe_memory_mb=0.001))
+    assert merges  # the tiny budget forced more than MAX_RUNS spill files
+    assert spilled == plain
+    assert len(plain) == 12_000
+
+
+def test_dedupe_budget_options_need_dedupe():
+    with pytest.raises(ValueError):
+        list(scraper.filter_rows([], dedupe_approx=True))
+
+
+def test_jobcol_round_trip_by_single_column(tmp_path):
+    rows = scraper.synthetic_rows(2_500) + [("Ünïcode title", "Ça & Co", "Zürich, ZH", "not a date")]
+    path = tmp_path / "jobs.jobcol"
+    with scraper.ColumnarWriter(path, row_group_size=1_000) as w:  # several row groups
+        w.write_rows(rows)
+    assert w.count == len(rows)
+    for i, name in enumerate(scraper.CSV_HEADER[:3]):
+        assert scraper.read_columnar(path, [name]) == {name: [r[i] for r in rows]}
+    dates = scraper.read_columnar(path, ["Date Posted"])["Date Posted"]
+    assert dates[:-1] == [scraper.datetime.strptime(r[3], "%Y-%m-%d").date() for r in rows[:-1]]
+    assert dates[-1] is None
+
+
+def test_columnar_output_refuses_append(tmp_path):
+    with pytest.raises(ValueError):
+        scraper._write_output(tmp_path / "jobs.jobcol", [], append=True)
+
+
+@pytest.mark.parametrize("budget, approx", [(0, False), (-1, False), (0, True), (-1, True), (1e-7, True)])
+def test_dedupe_rejects_bad_memory_budget(budget, approx):
+    with pytest.raises(ValueError):
+        list(scraper.filter_rows(scraper.synthetic_rows(10), dedupe=True, dedupe_approx=approx, dedupe_memory_mb=budget))
+
+
+def test_index_query_matches_snapshot_query(tmp_path):
+    rng = random.Random(7)
+    rows = [(
+        rng.choice(["Python Dev", "python dev", "Engineer", "Senior Engineer"]),
+        rng.choice(["Acme", "acme", "Beta LLC"]),
+        rng.choice(["Boston, MA", "boston, ma", "East Boston, NY", "Davidville, AP"]),
+        rng.choice(["2021-01-01", "2021-01-04", "2021-01-07", "bad", "", "Jan 03, 2021", "0001-01-01"]),
+    ) for _ in range(400)]
+    snap, idx = tmp_path / "jobs.snap", tmp_path / "idx"
+    scraper.save_snapshot(snap, rows)
+    scraper.save_indexes(idx, rows)
+    choices = {
+        "include": [["py"], ["senior", "acme"]],
+        "exclude": [["senior"], ["beta"]],
+        "location": ["boston"],
+        "state": ["MA", "ap "],
+        "location_prefix": ["bos", "East"],
+        "since_str": ["2021-01-04", "0001-01-01"],
+        "dedupe": [True],
+        "sort_by": ["date", "title"],
+        "limit": [0, 5],
+    }
+    for _ in range(150):
+        filters = {k: rng.choice(v) for k, v in choices.items() if rng.random() < 0.4}
+        scraper.query_snapshot_to_csv(snap, tmp_path / "a.csv", **filters)
+        scraper.query_index_to_csv(idx, tmp_path / "b.csv", **filters)
+        assert (tmp_path / "a.csv").read_text() == (tmp_path / "b.csv").read_text(), filters
+
+
+def test_incremental_runs_append_only_new_postings(tmp_path):
+    pages = {}
+    for name, n, start in (("a", 30, 0), ("b", 20, 30), ("c", 10, 50)):
+        pages[name] = tmp_path / f"{name}.html"
+        pages[name].write_text(scraper.synthetic_page(n, start), encoding="utf-8")
+    out, state = tmp_path / "jobs.csv", tmp_path / "jobs.state"
+
+    def run(*names, **kw):
+        return scraper.scrape_fake_jobs_to_csv(
+            out, from_files=[pages[n] for n in names], incremental=True, state_path=state, **kw
+        )
+
+    def csv_rows(path):
+        with path.open(newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    assert run("a") == 30
+    assert run("a", "b") == 20
+    lines = csv_rows(out)
+    assert lines[0] == list(scraper.CSV_HEADER)
+    assert lines.count(list(scraper.CSV_HEADER)) == 1
+    assert [tuple(r) for r in lines[31:]] == scraper._extract_cards(pages["b"].read_text(encoding="utf-8"))
+
+    seen = scraper.IncrementalState(state).seen
+    assert len(seen) == 50
+    scraper.IncrementalState(state).save()
+    assert scraper.IncrementalState(state).seen == seen
+    assert run("a", "b") == 0
+
+    before = out.read_bytes()
+    delta = tmp_path / "delta.csv"
+    assert run("b", "c", delta_path=delta) == 10
+    assert out.read_bytes() == before
+    assert [tuple(r) for r in csv_rows(delta)] == [tuple(scraper.CSV_HEADER)] + scraper._extract_cards(
+        pages["c"].read_text(encoding="utf-8")
+    )